@@ -0,0 +1,30 @@
+"""Celery tasks for analytics."""
+import json
+import logging
+from typing import Any
+
+from celery import shared_task
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.analytics.services.risk_calculator import RiskCalculator
+from apps.providers.models import Provider
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def analyze_provider_task(provider_id: int) -> dict[str, Any]:
+    """
+    Run provider risk analysis outside the request cycle.
+
+    Args:
+        provider_id: Primary key of the provider to analyze
+
+    Returns:
+        Analysis results, JSON-safe for the result backend
+    """
+    provider = Provider.objects.get(pk=provider_id)
+    results = RiskCalculator().analyze_provider(provider)
+
+    # Risk factors may hold Decimals, which the JSON result serializer rejects
+    return json.loads(json.dumps(results, cls=DjangoJSONEncoder))
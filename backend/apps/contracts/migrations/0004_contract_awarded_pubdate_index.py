@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0003_alter_contract_municipality_alter_contract_region"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(
+                fields=["awarded_to", "publication_date"], name="contract_awarded_pubdate_ix"
+            ),
+        ),
+    ]
@@ -138,6 +138,10 @@ class Contract(SoftDeleteModel):
             models.Index(fields=["status", "publication_date"]),
             models.Index(fields=["region", "contract_type"]),
             models.Index(fields=["risk_score"]),
+            # Per-provider contract date ranges (provider metrics recalculation)
+            models.Index(
+                fields=["awarded_to", "publication_date"], name="contract_awarded_pubdate_ix"
+            ),
         ]
 
     def __str__(self) -> str:
@@ -10,12 +10,16 @@ from datetime import datetime
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.db import transaction
 from django.utils import timezone
 
 from apps.contracts.models import RawContractData
 from apps.crawlers.models import CrawlerRun
 
+# Fields rewritten when a crawl sees a record again
+_RAW_UPDATE_FIELDS = ["raw_data", "source_url", "updated_at"]
+
 
 class CrawlerException(Exception):
     """Base exception for crawler errors."""
@@ -37,6 +41,12 @@ class BaseCrawler(ABC):
     source_platform: str = "unknown"
     source_url: str = ""
 
+    # Rows written per bulk_create/bulk_update round-trip
+    save_batch_size: int = 1000
+
+    # Keep-alive connections kept per host by the shared session
+    http_pool_maxsize: int = 20
+
     def __init__(self, **config: Any) -> None:
         """
         Initialize crawler.
@@ -49,6 +59,12 @@ class BaseCrawler(ABC):
         self.session = requests.Session()
         self.run: CrawlerRun | None = None
 
+        # Size the keep-alive pool for concurrent fetches so connections are
+        # reused instead of being dropped (and re-handshaked) when it is full
+        adapter = HTTPAdapter(pool_maxsize=self.http_pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Set default headers
         self.session.headers.update(
             {
@@ -89,6 +105,10 @@ class BaseCrawler(ABC):
         """
         Save parsed data to database.
 
+        Records are written in batches: existing rows are looked up with one
+        query per batch, new rows are inserted with bulk_create and existing
+        ones refreshed with bulk_update.
+
         Args:
             parsed_data: List of parsed contract dictionaries
 
@@ -99,39 +119,165 @@ class BaseCrawler(ABC):
         updated = 0
         failed = 0
 
+        valid_items = []
         for item in parsed_data:
-            try:
-                external_id = item.get("external_id")
-                if not external_id:
-                    self.logger.warning("Skipping item without external_id")
-                    failed += 1
-                    continue
-
-                # Use get_or_create to handle duplicates
-                raw_data, is_created = RawContractData.objects.get_or_create(
+            if not item.get("external_id"):
+                self.logger.warning("Skipping item without external_id")
+                failed += 1
+                continue
+            valid_items.append(item)
+
+        for start in range(0, len(valid_items), self.save_batch_size):
+            batch_created, batch_updated, batch_failed = self._save_batch(
+                valid_items[start:start + self.save_batch_size]
+            )
+            created += batch_created
+            updated += batch_updated
+            failed += batch_failed
+
+        return created, updated, failed
+
+    def _save_batch(self, items: list[dict]) -> tuple[int, int, int]:
+        """
+        Insert or update one batch of items that all have an external_id.
+
+        Args:
+            items: Parsed contract dictionaries
+
+        Returns:
+            Tuple of (created, updated, failed) counts for the batch
+        """
+        created = 0
+        updated = 0
+        failed = 0
+
+        external_ids = {item["external_id"] for item in items}
+        # all_objects so soft-deleted rows are seen (they still hold the unique key)
+        existing = {
+            record.external_id: record
+            for record in RawContractData.all_objects.filter(
+                source_platform=self.source_platform,
+                external_id__in=external_ids,
+            )
+        }
+
+        to_create: dict[str, RawContractData] = {}
+        to_update: dict[str, RawContractData] = {}
+        now = timezone.now()
+
+        for item in items:
+            external_id = item["external_id"]
+            source_url = item.get("source_url", "")
+
+            record = existing.get(external_id)
+            if record is not None and record.deleted_at is not None:
+                self.logger.error(f"Failed to save item: {external_id} is soft-deleted")
+                failed += 1
+                continue
+
+            if record is None and external_id in to_create:
+                # Repeated within the batch: the later copy updates the first
+                record = to_create[external_id]
+                record.raw_data = item
+                record.source_url = source_url
+                updated += 1
+                self.logger.debug(f"Updated: {external_id}")
+                continue
+
+            if record is None:
+                to_create[external_id] = RawContractData(
                     source_platform=self.source_platform,
                     external_id=external_id,
-                    defaults={
-                        "raw_data": item,
-                        "source_url": item.get("source_url", ""),
-                        "is_processed": False,
-                    },
+                    raw_data=item,
+                    source_url=source_url,
+                    is_processed=False,
                 )
+                created += 1
+                self.logger.debug(f"Created: {external_id}")
+            else:
+                record.raw_data = item
+                record.source_url = source_url
+                # bulk_update() does not apply auto_now
+                record.updated_at = now
+                to_update[external_id] = record
+                updated += 1
+                self.logger.debug(f"Updated: {external_id}")
 
-                if is_created:
-                    created += 1
-                    self.logger.debug(f"Created: {external_id}")
-                else:
-                    # Update existing record
-                    raw_data.raw_data = item
-                    raw_data.source_url = item.get("source_url", "")
-                    raw_data.save(update_fields=["raw_data", "source_url", "updated_at"])
-                    updated += 1
-                    self.logger.debug(f"Updated: {external_id}")
+        try:
+            with transaction.atomic():
+                if to_create:
+                    # A concurrent run may insert the same key after the lookup
+                    # above; update that row instead of failing the batch
+                    RawContractData.objects.bulk_create(
+                        to_create.values(),
+                        batch_size=self.save_batch_size,
+                        update_conflicts=True,
+                        unique_fields=["source_platform", "external_id"],
+                        update_fields=_RAW_UPDATE_FIELDS,
+                    )
+                if to_update:
+                    RawContractData.objects.bulk_update(
+                        to_update.values(),
+                        _RAW_UPDATE_FIELDS,
+                        batch_size=self.save_batch_size,
+                    )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to save batch of {len(items)} items, saving one by one: {e}"
+            )
+            # Items repeated within the batch were counted as updates on top of
+            # the records they fold into
+            repeated = created + updated - len(to_create) - len(to_update)
+            item_created, item_updated, item_failed = self._save_items(
+                list(to_create.values()), list(to_update.values())
+            )
+            return item_created, item_updated + repeated, failed + item_failed
+
+        return created, updated, failed
 
+    def _save_items(
+        self, to_create: list[RawContractData], to_update: list[RawContractData]
+    ) -> tuple[int, int, int]:
+        """
+        Save records one at a time, so a bad row only fails itself.
+
+        Args:
+            to_create: Records that did not exist when the batch was read
+            to_update: Existing records with new data applied
+
+        Returns:
+            Tuple of (created, updated, failed) counts
+        """
+        created = 0
+        updated = 0
+        failed = 0
+
+        for record in to_create:
+            try:
+                _, was_created = RawContractData.objects.update_or_create(
+                    source_platform=record.source_platform,
+                    external_id=record.external_id,
+                    defaults={"raw_data": record.raw_data, "source_url": record.source_url},
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to save item {record.external_id}: {e}")
+                failed += 1
+                continue
+
+            if was_created:
+                created += 1
+            else:
+                updated += 1
+
+        for record in to_update:
+            try:
+                with transaction.atomic():
+                    record.save(update_fields=_RAW_UPDATE_FIELDS)
             except Exception as e:
-                self.logger.error(f"Failed to save item: {e}")
+                self.logger.error(f"Failed to save item {record.external_id}: {e}")
                 failed += 1
+            else:
+                updated += 1
 
         return created, updated, failed
 
@@ -28,6 +28,7 @@ from apps.crawlers.utils import (
 
 # Phase 1 tools
 from apps.crawlers.tools import (
+    AtomParser,
     AtomZipHandler,
     SyndicationChainFollower,
     PlacspFieldsExtractor,
@@ -67,11 +68,16 @@ class PCSPCrawler(BaseCrawler):
         self.money_handler = MoneyHandler(logger=self.logger)
         self.region_extractor = RegionExtractor(logger=self.logger)
         
-        # Initialize Phase 1 tools
-        self.zip_handler = AtomZipHandler(
+        # Initialize Phase 1 tools (one ATOM parser shared by ZIP and chain handling)
+        self.atom_parser = AtomParser(
             session=self.session,
             logger=self.logger
         )
+        self.zip_handler = AtomZipHandler(
+            session=self.session,
+            logger=self.logger,
+            parser=self.atom_parser
+        )
         self.fields_extractor = PlacspFieldsExtractor(logger=self.logger)
         self.zip_orchestrator = ZipOrchestrator(
             session=self.session,
@@ -79,7 +85,8 @@ class PCSPCrawler(BaseCrawler):
         )
         self.chain_follower = SyndicationChainFollower(
             session=self.session,
-            logger=self.logger
+            logger=self.logger,
+            parser=self.atom_parser
         )
         
         # Initialize services (with dependency injection)
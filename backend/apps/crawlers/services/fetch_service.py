@@ -4,6 +4,7 @@ Orchestrates the data fetching process using Phase 1 tools.
 Supports incremental mode to fetch only new data since last successful run.
 Follows Single Responsibility Principle.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from datetime import datetime
 import logging
@@ -110,22 +111,18 @@ class FetchService:
             self.logger.info(f"Processing {len(zips)} ZIP files with concurrent processing")
 
             # Use concurrent processor for parallel ZIP processing
-            processor = ZipConcurrentProcessor(
+            with ZipConcurrentProcessor(
                 max_workers=6,  # 6 concurrent ZIP downloads
                 rate_limit=3.0,  # 3 requests per second to avoid overwhelming server
                 logger=self.logger
-            )
-
-            results, stats = processor.process_items_concurrent(
-                items=zips,
-                process_func=self._process_zip,
-                item_name="ZIP"
-            )
-
-            # Flatten results from concurrent processing
-            for result in results:
-                if result:
-                    contracts.extend(result)
+            ) as processor:
+                # Each ZIP's contracts are flattened as soon as it completes
+                _, stats = processor.process_items_concurrent(
+                    items=zips,
+                    process_func=self._process_zip,
+                    item_name="ZIP",
+                    on_result=contracts.extend
+                )
 
             self.logger.info(
                 f"Fetched {len(contracts)} total contracts "
@@ -172,17 +169,18 @@ class FetchService:
         contracts = []
         
         try:
-            # Fetch and prepare ZIP
-            zip_content, base_atom_filename = self.zip_orchestrator.fetch_and_prepare_zip(
+            # Fetch and prepare ZIP (spooled to a temporary file)
+            zip_file, base_atom_filename = self.zip_orchestrator.fetch_and_prepare_zip(
                 zip_info
             )
             
-            if not base_atom_filename:
-                self.logger.warning(f"Could not identify ATOM file in {zip_info.filename}")
-                return contracts
-            
-            # Extract ATOM feed from ZIP
-            feed = self.zip_handler.extract_atom_from_zip(zip_content, base_atom_filename)
+            with zip_file:
+                if not base_atom_filename:
+                    self.logger.warning(f"Could not identify ATOM file in {zip_info.filename}")
+                    return contracts
+                
+                # Extract ATOM feed from ZIP
+                feed = self.zip_handler.extract_atom_from_zip(zip_file, base_atom_filename)
             
             if not feed:
                 return contracts
@@ -222,17 +220,16 @@ class FetchService:
             return []
 
         # Use concurrent processor for parallel entry processing
-        processor = FeedConcurrentProcessor(
+        with FeedConcurrentProcessor(
             max_workers=4,  # 4 concurrent entry processors
-            rate_limit=100.0,  # No rate limit for local processing
+            rate_limit=None,  # No rate limit for local processing
             logger=self.logger
-        )
-
-        results, stats = processor.process_items_concurrent(
-            items=feed.entries,
-            process_func=self._parse_entry_wrapper,
-            item_name="entry"
-        )
+        ) as processor:
+            results, stats = processor.process_items_concurrent(
+                items=feed.entries,
+                process_func=self._parse_entry_wrapper,
+                item_name="entry"
+            )
 
         self.logger.debug(
             f"Processed {len(feed.entries)} entries "
@@ -262,27 +259,37 @@ class FetchService:
     
     def _follow_chain(self, next_url: str) -> List[Dict]:
         """Follow syndication chain from URL.
-        
+
+        The next feed in the chain is fetched and parsed on a background
+        thread while the entries of the current one are being processed.
+
         Args:
             next_url: URL to next feed in chain
-            
+
         Returns:
-            List of contract dictionaries from chain
+            List of contract dictionaries from chain, oldest feed first
         """
-        contracts = []
-        
+        # Feeds arrive newest first; keep per-feed results so they can be
+        # emitted oldest to newest and later entries still win on save
+        feed_contracts: List[List[Dict]] = []
+
         try:
-            feeds = self.chain_follower.follow_chain(next_url, max_iterations=10)
-            
-            for feed in feeds:
-                try:
-                    contracts_from_feed = self._process_feed(feed)
-                    contracts.extend(contracts_from_feed)
-                except Exception as e:
-                    self.logger.warning(f"Error processing feed in chain: {e}")
-                    continue
-                    
+            feeds = self.chain_follower.iter_chain(next_url, max_iterations=10)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = executor.submit(next, feeds, None)
+                while (feed := pending.result()) is not None:
+                    pending = executor.submit(next, feeds, None)
+                    try:
+                        feed_contracts.append(self._process_feed(feed))
+                    except Exception as e:
+                        self.logger.warning(f"Error processing feed in chain: {e}")
+                        continue
+
         except AtomParseError as e:
             self.logger.warning(f"Failed to follow chain from {next_url}: {e}")
-        
+
+        contracts = []
+        for contracts_from_feed in reversed(feed_contracts):
+            contracts.extend(contracts_from_feed)
         return contracts
@@ -4,6 +4,7 @@ Orchestrates parsing of raw contract data using utilities and strategies.
 Follows Single Responsibility Principle.
 """
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
 
@@ -248,31 +249,7 @@ class ParsingService:
         if not procedure_type_raw:
             return "OPEN"
         
-        code = str(procedure_type_raw).strip().lower()
-        
-        # PLACSP numeric codes
-        code_map = {
-            "1": "OPEN",
-            "2": "RESTRICTED",
-            "3": "NEGOTIATED",
-            "4": "COMPETITIVE_DIALOGUE",
-            "5": "COMPETITIVE_DIALOGUE",
-        }
-        
-        if code in code_map:
-            return code_map[code]
-        
-        # Text matching (Spanish keywords match PLACSP external data)
-        if any(word in code for word in ["abierto", "open"]):
-            return "OPEN"
-        elif any(word in code for word in ["restringido", "restricted"]):
-            return "RESTRICTED"
-        elif any(word in code for word in ["negociado", "negotiated"]):
-            return "NEGOTIATED"
-        elif any(word in code for word in ["diálogo", "dialogue"]):
-            return "COMPETITIVE_DIALOGUE"
-        
-        return "OPEN"
+        return _map_procedure_code(str(procedure_type_raw).strip().lower())
     
     def _infer_status(self, data: Dict) -> str:
         """Infer contract status from data."""
@@ -327,3 +304,34 @@ class ParsingService:
             return "MIXED"
 
         return "OTHER"
+
+
+# Procedure codes come from a small vocabulary that repeats across
+# thousands of contracts, so their mapping is cached at module level.
+
+@lru_cache(maxsize=65536)
+def _map_procedure_code(code: str) -> str:
+    """Map a normalized (stripped, lowercased) procedure code to a standard type."""
+    # PLACSP numeric codes
+    code_map = {
+        "1": "OPEN",
+        "2": "RESTRICTED",
+        "3": "NEGOTIATED",
+        "4": "COMPETITIVE_DIALOGUE",
+        "5": "COMPETITIVE_DIALOGUE",
+    }
+    
+    if code in code_map:
+        return code_map[code]
+    
+    # Text matching (Spanish keywords match PLACSP external data)
+    if any(word in code for word in ["abierto", "open"]):
+        return "OPEN"
+    elif any(word in code for word in ["restringido", "restricted"]):
+        return "RESTRICTED"
+    elif any(word in code for word in ["negociado", "negotiated"]):
+        return "NEGOTIATED"
+    elif any(word in code for word in ["diálogo", "dialogue"]):
+        return "COMPETITIVE_DIALOGUE"
+    
+    return "OPEN"
@@ -5,6 +5,7 @@ available ZIP files from PCSP Datos Abiertos.
 """
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Protocol
 import logging
 
@@ -102,8 +103,8 @@ class SindicacionDiscoveryStrategy:
                 zips.append(zip_info)
                 self.logger.debug(f"Found ZIP: {zip_filename}")
 
-        # Sort chronologically (oldest first)
-        zips.sort()
+        # Sort chronologically (oldest first); every ZIP here has a date
+        zips.sort(key=attrgetter("date"))
         self.logger.info(f"Discovered {len(zips)} ZIPs via sindicación strategy")
 
         return zips
@@ -134,6 +134,9 @@ class LegacyFormatParser:
         Returns:
             True if entry has content field with data
         """
+        # Check the embedded element first so it isn't serialized just to test it
+        if getattr(entry, 'content_element', None) is not None:
+            return True
         return hasattr(entry, 'content') and bool(entry.content)
     
     def parse(self, entry: any) -> Optional[PlacspLicitacion]:
@@ -146,10 +149,17 @@ class LegacyFormatParser:
             PlacspLicitacion object or None
         """
         try:
-            licitacion = self.fields_extractor.extract_from_atom_entry_xml(
-                entry.content,
-                entry.entry_id
-            )
+            content_element = getattr(entry, 'content_element', None)
+            if content_element is not None:
+                licitacion = self.fields_extractor.extract_from_content_element(
+                    content_element,
+                    entry.entry_id
+                )
+            else:
+                licitacion = self.fields_extractor.extract_from_atom_entry_xml(
+                    entry.content,
+                    entry.entry_id
+                )
             
             if licitacion:
                 # Add metadata from ATOM entry
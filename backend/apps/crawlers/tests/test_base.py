@@ -2,6 +2,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import DatabaseError
 from django.test import TestCase
 
 from apps.contracts.models import RawContractData
@@ -72,6 +73,14 @@ class TestBaseCrawler(TestCase):
         assert crawler.config == {"test_param": "value"}
         assert crawler.session is not None
 
+    @patch("apps.crawlers.base.HTTPAdapter")
+    def test_session_pool_sized_for_concurrency(self, mock_adapter):
+        """Test the shared session keeps enough keep-alive connections per host."""
+        crawler = SimpleCrawler()
+
+        mock_adapter.assert_called_once_with(pool_maxsize=SimpleCrawler.http_pool_maxsize)
+        assert crawler.session.get_adapter("https://example.com") is mock_adapter.return_value
+
     def test_save_creates_records(self):
         """Test save creates RawContractData records."""
         crawler = SimpleCrawler()
@@ -137,6 +146,53 @@ class TestBaseCrawler(TestCase):
         assert failed == 1
         assert RawContractData.objects.count() == 0
 
+    def test_save_in_batches(self):
+        """Test save splits items across bulk batches and counts repeats as updates."""
+        RawContractData.objects.create(
+            source_platform="TEST",
+            external_id="TEST-001",
+            raw_data={"old": "data"},
+        )
+
+        crawler = SimpleCrawler()
+        crawler.save_batch_size = 2
+        parsed_data = [
+            {"external_id": "TEST-001", "title": "Updated"},
+            {"external_id": "TEST-002", "title": "New"},
+            {"external_id": "TEST-003", "title": "New"},
+            {"external_id": "TEST-003", "title": "Newer"},
+        ]
+
+        created, updated, failed = crawler.save(parsed_data)
+
+        assert (created, updated, failed) == (2, 2, 0)
+        assert RawContractData.objects.count() == 3
+        assert RawContractData.objects.get(external_id="TEST-003").raw_data["title"] == "Newer"
+
+    def test_save_falls_back_to_single_items(self):
+        """Test a failed bulk write is retried item by item."""
+        RawContractData.objects.create(
+            source_platform="TEST",
+            external_id="TEST-001",
+            raw_data={"old": "data"},
+        )
+
+        crawler = SimpleCrawler()
+        parsed_data = [
+            {"external_id": "TEST-001", "title": "Updated"},
+            {"external_id": "TEST-002", "title": "New"},
+            {"external_id": "TEST-002", "title": "Newer"},
+        ]
+
+        with patch.object(
+            RawContractData.objects, "bulk_update", side_effect=DatabaseError("boom")
+        ):
+            created, updated, failed = crawler.save(parsed_data)
+
+        assert (created, updated, failed) == (1, 2, 0)
+        assert RawContractData.objects.get(external_id="TEST-001").raw_data["title"] == "Updated"
+        assert RawContractData.objects.get(external_id="TEST-002").raw_data["title"] == "Newer"
+
     def test_run_crawler_success(self):
         """Test successful crawler execution."""
         crawler = SimpleCrawler()
@@ -1,12 +1,14 @@
 """Tests for concurrent processor."""
+import threading
 import time
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from django.test import TestCase
 
 from apps.crawlers.tools.concurrent_processor import (
+    MAX_ERROR_SAMPLES,
     ConcurrentProcessor,
     ZipConcurrentProcessor,
     FeedConcurrentProcessor,
@@ -38,6 +40,20 @@ class TestRateLimiter(TestCase):
         # Should take at least 200ms for 3 requests (2 intervals)
         assert elapsed >= 0.19  # Allow small margin
 
+    def test_rate_limiter_allows_burst_after_idle(self):
+        """Test a full bucket lets burst-size requests through without waiting."""
+        limiter = RateLimiter(requests_per_second=2.0, burst=4)
+
+        start = time.time()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.time() - start < 0.1
+
+        # Bucket is empty now: the next request waits for a refill
+        start = time.time()
+        limiter.acquire()
+        assert time.time() - start >= 0.45
+
 
 class TestProcessingStats(TestCase):
     """Test processing statistics."""
@@ -53,6 +69,17 @@ class TestProcessingStats(TestCase):
         stats = ProcessingStats(total_items=10, successful=8, failed=2)
         assert stats.success_rate == 80.0
     
+    def test_error_samples_bounded(self):
+        """Test only the most recent errors are kept while failed keeps counting."""
+        stats = ProcessingStats()
+        for i in range(MAX_ERROR_SAMPLES + 10):
+            stats.failed += 1
+            stats.errors.append({'item_id': str(i), 'error': 'boom'})
+
+        assert stats.failed == MAX_ERROR_SAMPLES + 10
+        assert len(stats.errors) == MAX_ERROR_SAMPLES
+        assert stats.errors[0]['item_id'] == '10'
+
     def test_average_duration(self):
         """Test average duration calculation."""
         stats = ProcessingStats(total_items=5, total_duration=10.0)
@@ -71,12 +98,39 @@ class TestConcurrentProcessor(TestCase):
         )
         assert processor.max_workers == 4
         assert processor.rate_limiter.requests_per_second == 5.0
+
+    def test_rate_limit_disabled(self):
+        """Test rate_limit=None skips the limiter entirely."""
+        processor = ConcurrentProcessor(max_workers=2, rate_limit=None)
+        assert processor.rate_limiter is None
+
+        results, stats = processor.process_items_concurrent(
+            items=list(range(10)),
+            process_func=lambda item: {'id': item},
+            item_name="test_item"
+        )
+
+        assert len(results) == 10
+        assert stats.successful == 10
     
     def test_session_with_retries(self):
         """Test session is created with retry configuration."""
         processor = ConcurrentProcessor(retry_attempts=3, retry_backoff=2.0)
         assert processor.session is not None
         assert processor.session.headers['User-Agent'].startswith('PublicWorksAI')
+
+    def test_session_created_on_first_use(self):
+        """Test no session is built for processors that never make requests."""
+        with ConcurrentProcessor(max_workers=2, rate_limit=None) as processor:
+            processor.process_items_concurrent(
+                items=[1, 2],
+                process_func=lambda item: {'id': item},
+                item_name="test_item"
+            )
+            assert processor._session is None
+
+            session = processor.session
+            assert processor.session is session
     
     def test_process_items_concurrent_success(self):
         """Test successful concurrent processing."""
@@ -122,6 +176,73 @@ class TestConcurrentProcessor(TestCase):
         assert stats.failed == 2
         assert len(stats.errors) == 2
     
+    def test_process_items_on_result_sink(self):
+        """Test results are handed to on_result instead of being collected."""
+        processor = ConcurrentProcessor(max_workers=2, rate_limit=None)
+        sink = []
+
+        results, stats = processor.process_items_concurrent(
+            items=[1, 2, 3],
+            process_func=lambda item: [item, item],
+            item_name="test_item",
+            on_result=sink.extend
+        )
+
+        assert results == []
+        assert sorted(sink) == [1, 1, 2, 2, 3, 3]
+        assert stats.successful == 3
+
+    def test_process_items_bounded_in_flight(self):
+        """Test only a bounded window of items is submitted at a time."""
+        processor = ConcurrentProcessor(max_workers=2, rate_limit=None)
+        processor.in_flight_per_worker = 2
+        in_flight = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+        original_submit = ThreadPoolExecutor.submit
+
+        def finished(future):
+            with lock:
+                in_flight['now'] -= 1
+
+        def counting_submit(executor, fn, *args, **kwargs):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            future = original_submit(executor, fn, *args, **kwargs)
+            future.add_done_callback(finished)
+            return future
+
+        with patch.object(ThreadPoolExecutor, 'submit', counting_submit):
+            results, stats = processor.process_items_concurrent(
+                items=list(range(50)),
+                process_func=lambda item: {'id': item},
+                item_name="test_item"
+            )
+
+        assert stats.successful == 50
+        assert sorted(r['id'] for r in results) == list(range(50))
+        assert in_flight['peak'] <= 4
+
+    def test_process_items_fail_fast(self):
+        """Test fail_fast stops submitting items after the first failure."""
+        processor = ConcurrentProcessor(max_workers=1, rate_limit=None)
+        processed = []
+
+        def fail_on_first(item):
+            processed.append(item)
+            raise ValueError("auth rejected")
+
+        results, stats = processor.process_items_concurrent(
+            items=list(range(100)),
+            process_func=fail_on_first,
+            item_name="test_item",
+            fail_fast=True
+        )
+
+        assert results == []
+        assert stats.failed >= 1
+        assert len(processed) <= processor.max_workers * processor.in_flight_per_worker
+
     def test_process_empty_list(self):
         """Test processing empty list."""
         processor = ConcurrentProcessor(max_workers=2)
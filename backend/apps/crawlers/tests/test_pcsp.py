@@ -34,6 +34,13 @@ class TestPCSPCrawler(TestCase):
         assert crawler.parsing_service is not None
         assert crawler.fetch_service is not None
 
+    def test_atom_parser_shared(self):
+        """Test ZIP handler and chain follower share one ATOM parser."""
+        crawler = PCSPCrawler()
+
+        assert crawler.zip_handler.parser is crawler.atom_parser
+        assert crawler.chain_follower.parser is crawler.atom_parser
+
     def test_parse_success(self):
         """Test parsing valid contract data."""
         crawler = PCSPCrawler()
@@ -98,6 +105,20 @@ class TestPCSPCrawler(TestCase):
         # Invalid
         assert crawler.date_handler.parse_to_iso("invalid") is None
 
+    def test_date_handler_all_formats(self):
+        """Test every supported format, including shapes the format guess misses."""
+        crawler = PCSPCrawler()
+
+        for date_str in [
+            "2025-11-29", "29/11/2025", "29-11-2025", "2025/11/29", "29.11.2025",
+            "2025-11-29T18:00:00", "2025-11-29T18:00:00.000", "29/11/2025 ",
+        ]:
+            assert crawler.date_handler.parse_to_iso(date_str) == "2025-11-29"
+
+        # Non-padded values fall back to trying every format
+        assert crawler.date_handler.parse_to_iso("1/2/2025") == "2025-02-01"
+        assert crawler.date_handler.parse_to_iso("31/02/2025") is None
+
     def test_money_handler_parse(self):
         """Test money handler parsing."""
         crawler = PCSPCrawler()
@@ -117,6 +138,20 @@ class TestPCSPCrawler(TestCase):
         # Invalid
         assert crawler.money_handler.parse_decimal("invalid") is None
 
+    def test_money_handler_repeated_and_numeric_values(self):
+        """Test cached string parsing and numeric inputs."""
+        crawler = PCSPCrawler()
+
+        # Repeated strings hit the cache and still parse the same way
+        for _ in range(2):
+            assert crawler.money_handler.parse_decimal("1.000,00") == Decimal("1000.00")
+            assert crawler.money_handler.parse_decimal("abc") is None
+
+        assert crawler.money_handler.parse_decimal(1500) == Decimal("1500")
+        assert crawler.money_handler.parse_decimal(12.5) == Decimal("12.5")
+        assert crawler.money_handler.parse_decimal(Decimal("7.10")) == Decimal("7.10")
+        assert crawler.money_handler.parse_decimal(0) is None
+
     def test_region_extractor(self):
         """Test region extraction."""
         crawler = PCSPCrawler()
@@ -126,6 +161,26 @@ class TestPCSPCrawler(TestCase):
         assert crawler.region_extractor.extract_region("Comunidad de Madrid") == "Comunidad de Madrid"
         assert crawler.region_extractor.extract_region("Unknown Authority") == ""
 
+    def test_region_extractor_ignores_accents_and_case(self):
+        """Test authority names match keywords regardless of accents and case."""
+        crawler = PCSPCrawler()
+
+        assert crawler.region_extractor.extract_region("Ayuntamiento de Malaga") == "Andalucía"
+        assert crawler.region_extractor.extract_region("DIPUTACIÓN DE CÁDIZ") == "Andalucía"
+        assert crawler.region_extractor.extract_region("Concello da Coruna") == "Galicia"
+
+    def test_region_extractor_caches_repeated_authorities(self):
+        """Test repeated authority names are served from the match cache."""
+        from apps.crawlers.utils.region_extractor import _match_region
+
+        crawler = PCSPCrawler()
+        _match_region.cache_clear()
+
+        crawler.region_extractor.extract_region("Ayuntamiento de Sevilla")
+        crawler.region_extractor.extract_region("Ayuntamiento de Sevilla")
+
+        assert _match_region.cache_info().hits == 1
+
     def test_parsing_service_contract_type_inference(self):
         """Test contract type inference in parsing service."""
         crawler = PCSPCrawler()
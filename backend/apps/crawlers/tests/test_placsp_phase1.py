@@ -10,22 +10,20 @@ from unittest.mock import Mock, patch
 from io import BytesIO
 from zipfile import ZipFile
 
-from apps.crawlers.implementations.atom_parser import (
+from apps.crawlers.tools.atom_parser import (
     AtomParser,
     AtomParseError,
-    AtomEntry,
-    AtomFeed,
     AtomZipHandler,
     SyndicationChainFollower,
 )
-from apps.crawlers.implementations.placsp_fields_extractor import (
+from apps.crawlers.tools.placsp_fields_extractor import (
     PlacspFieldsExtractor,
     PlacspLicitacion,
     ContractLot,
     AwardedCompany,
     ContractResult,
 )
-from apps.crawlers.implementations.zip_orchestrator import (
+from apps.crawlers.tools.zip_orchestrator import (
     ZipOrchestrator,
     PlacspZipInfo,
     PlacspZipDateExtractor,
@@ -144,6 +142,18 @@ class TestAtomParser:
         assert entry.updated == "2021-01-15T10:30:00Z"
         assert entry.content is not None
 
+    def test_entry_content_serialized_lazily(self):
+        """Test embedded XML content is kept as an element until read as text."""
+        parser = AtomParser()
+        feed = parser.parse_atom_bytes(SAMPLE_ATOM_FEED.encode("utf-8"))
+
+        entry = feed.entries[0]
+        assert entry.content_element is not None
+        assert entry.content_text is None
+
+        assert "codigoExpediente" in entry.content
+        assert entry.content_text is entry.content
+
     def test_parse_invalid_xml(self):
         """Test parsing invalid XML raises error."""
         parser = AtomParser()
@@ -228,11 +238,24 @@ class TestAtomZipHandler:
         assert "file2.xml" in files
         assert "readme.txt" not in files
 
+    def test_open_xml_files_lazily(self):
+        """Test listing XML members without reading them."""
+        zip_buffer = BytesIO()
+        with ZipFile(zip_buffer, "w") as zf:
+            zf.writestr("file1.atom", b"<feed/>")
+            zf.writestr("file2.xml", b"<data/>")
+            zf.writestr("readme.txt", b"text")
+
+        handler = AtomZipHandler()
+        with handler.open_xml_files_from_zip(zip_buffer.getvalue()) as members:
+            assert members.names() == ["file1.atom", "file2.xml"]
+            assert members.read("file2.xml") == b"<data/>"
+
 
 class TestSyndicationChainFollower:
     """Test syndication chain following."""
 
-    @patch("apps.crawlers.implementations.atom_parser.requests.Session.get")
+    @patch("apps.crawlers.tools.atom_parser.requests.Session.get")
     def test_follow_chain_single_feed(self, mock_get):
         """Test following chain with single feed (end of chain)."""
         # Create feed without next_url to indicate end of chain
@@ -241,7 +264,7 @@ class TestSyndicationChainFollower:
         )
 
         mock_response = Mock()
-        mock_response.content = single_feed.encode("utf-8")
+        mock_response.raw = BytesIO(single_feed.encode("utf-8"))
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -252,8 +275,10 @@ class TestSyndicationChainFollower:
         assert len(feeds) == 1
         assert feeds[0].entries[0].entry_id == "urn:uuid:1234-5678"
         assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
 
-    @patch("apps.crawlers.implementations.atom_parser.requests.Session.get")
+    @patch("apps.crawlers.tools.atom_parser.requests.Session.get")
     def test_follow_chain_multiple_feeds(self, mock_get):
         """Test following chain with multiple feeds."""
         # Create a feed with reference to previous
@@ -267,8 +292,8 @@ class TestSyndicationChainFollower:
         )
 
         responses = [
-            Mock(content=SAMPLE_ATOM_FEED.encode("utf-8")),
-            Mock(content=feed2_no_link.encode("utf-8")),
+            Mock(raw=BytesIO(SAMPLE_ATOM_FEED.encode("utf-8"))),
+            Mock(raw=BytesIO(feed2_no_link.encode("utf-8"))),
         ]
 
         mock_get.side_effect = responses
@@ -281,6 +306,32 @@ class TestSyndicationChainFollower:
         # Should get both feeds in chronological order (oldest first)
         assert len(feeds) == 2
         assert feeds[0].feed_id == "urn:uuid:december-2020"  # Oldest first
+        assert mock_get.call_args.args[0] == (
+            "http://example.com/datos/licitacionesPerfilesContratanteCompleto3_202012.atom"
+        )
+
+    @patch("apps.crawlers.tools.atom_parser.requests.Session.get")
+    def test_iter_chain_yields_as_fetched(self, mock_get):
+        """Test iter_chain yields newest first and fetches lazily."""
+        feed2 = SAMPLE_ATOM_FEED.replace(
+            "urn:uuid:60a76c80-d399-11d9-b91C-0003939e0af6", "urn:uuid:december-2020"
+        ).replace(
+            '<link rel="previous-archive" '
+            'href="/datos/licitacionesPerfilesContratanteCompleto3_202012.atom"/>',
+            "",
+        )
+        mock_get.side_effect = [
+            Mock(raw=BytesIO(SAMPLE_ATOM_FEED.encode("utf-8"))),
+            Mock(raw=BytesIO(feed2.encode("utf-8"))),
+        ]
+
+        follower = SyndicationChainFollower()
+        feeds = follower.iter_chain("http://example.com/feed.atom")
+
+        assert next(feeds).feed_id == "urn:uuid:60a76c80-d399-11d9-b91C-0003939e0af6"
+        assert mock_get.call_count == 1
+        assert next(feeds).feed_id == "urn:uuid:december-2020"
+        assert next(feeds, None) is None
 
 
 # ============================================================================
@@ -318,6 +369,94 @@ class TestPlacspFieldsExtractor:
         assert licitacion.budget_with_taxes == Decimal("121000.00")
         assert licitacion.contract_type == "Servicios"
 
+    def test_extract_boolean_flags(self):
+        """Test Spanish and xs:boolean yes/no flags, regardless of case."""
+        extractor = PlacspFieldsExtractor()
+
+        for flag, expected in [("Sí", True), ("si", True), ("1", True), ("No", False)]:
+            test_xml = f"""<pcsp:licitacion xmlns:pcsp="http://www.plataforma.es/pcsp">
+                <pcsp:subcontratacionPermitida>{flag}</pcsp:subcontratacionPermitida>
+            </pcsp:licitacion>"""
+
+            licitacion = extractor.extract_from_atom_entry_xml(test_xml, "urn:uuid:1")
+
+            assert licitacion.subcontracting_allowed is expected
+
+    def test_extract_codice_entry(self):
+        """Test extracting fields from a CODICE ContractFolderStatus entry."""
+        from lxml import etree
+
+        extractor = PlacspFieldsExtractor()
+
+        entry_xml = b"""<entry xmlns="http://www.w3.org/2005/Atom"
+            xmlns:cbc="urn:dgpe:names:draft:codice:schema:xsd:CommonBasicComponents-2"
+            xmlns:cac="urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2"
+            xmlns:cac-place-ext="urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2">
+            <title>Obras de pavimentacion</title>
+            <cac-place-ext:ContractFolderStatus>
+                <cbc:ContractFolderID> EXP-1 </cbc:ContractFolderID>
+                <cac:ProcurementProject>
+                    <cbc:TypeCode>3</cbc:TypeCode>
+                    <cac:BudgetAmount>
+                        <cbc:EstimatedOverallContractAmount>1000.50</cbc:EstimatedOverallContractAmount>
+                    </cac:BudgetAmount>
+                    <cac:RequiredCommodityClassification>
+                        <cbc:ItemClassificationCode>45233</cbc:ItemClassificationCode>
+                    </cac:RequiredCommodityClassification>
+                </cac:ProcurementProject>
+                <cac:TenderResult>
+                    <cbc:ResultCode>8</cbc:ResultCode>
+                    <cac-place-ext:AwardedSupplier>
+                        <cac:SupplierParty><cac:Party>
+                            <cac:PartyName><cbc:Name>ACME</cbc:Name></cac:PartyName>
+                        </cac:Party></cac:SupplierParty>
+                    </cac-place-ext:AwardedSupplier>
+                </cac:TenderResult>
+            </cac-place-ext:ContractFolderStatus>
+        </entry>"""
+
+        licitacion = extractor.extract_from_atom_entry_element(etree.fromstring(entry_xml), "id-1")
+
+        assert licitacion.expedition_number == "EXP-1"
+        assert licitacion.contract_object == "Obras de pavimentacion"
+        assert licitacion.contract_type == "3"
+        assert licitacion.budget_without_taxes == Decimal("1000.50")
+        assert licitacion.cpv_code == "45233"
+        assert licitacion.results[0].result_status == "8"
+        assert licitacion.results[0].awarded_companies[0].name == "ACME"
+
+    def test_summary_amount_formats(self):
+        """Test the summary "Importe" field accepts both number formats."""
+        extractor = PlacspFieldsExtractor()
+
+        for amount, expected in [
+            ("24793.39 EUR", Decimal("24793.39")),
+            ("1.234,56 EUR", Decimal("1234.56")),
+            ("1,234.56 EUR", Decimal("1234.56")),
+        ]:
+            licitacion = PlacspLicitacion(identifier="id-1", link="", update_date="")
+            extractor._extract_from_summary(f"Id licitación: X; Importe: {amount}", licitacion)
+            assert licitacion.budget_without_taxes == expected
+
+    def test_extract_codice_entry_namespace_variant(self):
+        """Test ContractFolderStatus is found under the non-extension namespace too."""
+        from lxml import etree
+
+        extractor = PlacspFieldsExtractor()
+
+        entry_xml = b"""<entry xmlns="http://www.w3.org/2005/Atom"
+            xmlns:cbc="urn:dgpe:names:draft:codice:schema:xsd:CommonBasicComponents-2"
+            xmlns:cac="urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2">
+            <title>Suministro</title>
+            <cac:ContractFolderStatus>
+                <cbc:ContractFolderID>EXP-2</cbc:ContractFolderID>
+            </cac:ContractFolderStatus>
+        </entry>"""
+
+        licitacion = extractor.extract_from_atom_entry_element(etree.fromstring(entry_xml), "id-2")
+
+        assert licitacion.expedition_number == "EXP-2"
+
     def test_extract_lots(self):
         """Test extracting lots from licitacion."""
         extractor = PlacspFieldsExtractor()
@@ -411,6 +550,37 @@ class TestPlacspFieldsExtractor:
         assert isinstance(data["budget_without_taxes"], float)
         assert data["budget_without_taxes"] == 100000.0
 
+    def test_to_dict_nested_records(self):
+        """Test nested lots/results/companies are converted with their Decimals."""
+        licitacion = PlacspLicitacion(
+            identifier="id-1",
+            link="",
+            update_date="",
+            estimated_value=Decimal("0"),
+            lots=[ContractLot(lot_number="1", budget_with_taxes=Decimal("605.00"))],
+            results=[
+                ContractResult(
+                    lot_number="1",
+                    awarded_companies=[
+                        AwardedCompany(name="ACME", award_amount_without_taxes=Decimal("500"))
+                    ],
+                )
+            ],
+        )
+
+        data = licitacion.to_dict()
+
+        assert data["estimated_value"] is None
+        assert data["lots"][0] == {
+            "lot_number": "1",
+            "object": None,
+            "budget_without_taxes": None,
+            "budget_with_taxes": 605.0,
+            "cpv_code": None,
+            "execution_place": None,
+        }
+        assert data["results"][0]["awarded_companies"][0]["award_amount_without_taxes"] == 500.0
+
 
 # ============================================================================
 # ZIP ORCHESTRATOR TESTS
@@ -445,6 +615,19 @@ class TestPlacspZipDateExtractor:
 
         assert synd_id == "3"
 
+    def test_extract_date_is_cached(self):
+        """Test repeated filenames are served from the date cache."""
+        from apps.crawlers.tools.zip_orchestrator import _extract_zip_date
+
+        _extract_zip_date.cache_clear()
+        filename = "licitacionesPerfilesContratanteCompleto3_202101.zip"
+
+        first = PlacspZipDateExtractor.extract_date(filename)
+        second = PlacspZipDateExtractor.extract_date(filename)
+
+        assert first == second == datetime(2021, 1, 1)
+        assert _extract_zip_date.cache_info().hits == 1
+
     def test_invalid_month(self):
         """Test handling invalid month."""
         filename = "licitacionesPerfilesContratanteCompleto3_202113.zip"
@@ -473,6 +656,33 @@ class TestZipOrchestrator:
         assert sorted_zips[1].filename == "file_202102.zip"
         assert sorted_zips[2].filename == "file_202103.zip"
 
+    def test_read_central_directory_matches_zipfile(self):
+        """Test the central directory reader agrees with zipfile and rejects what it can't read."""
+        from apps.crawlers.tools.zip_orchestrator import (
+            _locate_central_directory,
+            _read_central_directory,
+        )
+
+        def list_names(zip_content):
+            located = _locate_central_directory(zip_content)
+            if located is None:
+                return None
+            eocd, total_entries, cd_size, cd_offset = located
+            members = _read_central_directory(zip_content[cd_offset:eocd], total_entries)
+            return None if members is None else [name for name, _, _ in members]
+
+        zip_buffer = BytesIO()
+        with ZipFile(zip_buffer, "w") as zf:
+            zf.writestr("base.atom", b"<feed/>")
+            zf.writestr("dated_202101.atom", b"<feed/>")
+            zf.writestr("año/datos.xml", b"<data/>")
+            zf.comment = b"PLACSP"
+        zip_content = zip_buffer.getvalue()
+
+        assert list_names(zip_content) == ZipFile(BytesIO(zip_content)).namelist()
+        assert list_names(b"prefix" + zip_content) is None
+        assert list_names(b"not a zip") is None
+
     def test_identify_base_atom_filename(self):
         """Test identifying base ATOM filename in ZIP."""
         orchestrator = ZipOrchestrator()
@@ -489,6 +699,105 @@ class TestZipOrchestrator:
         # Should identify the one without date suffix
         assert base_atom == "licitacionesPerfilesContratanteCompleto3.atom"
 
+    def test_discover_zips_from_url(self):
+        """Test PLACSP ZIP links are picked out of a directory listing."""
+        listing = b"""<html><body>
+            <a href="/datos/PLACSP_licitacionesPerfilesContratanteCompleto3_202101.zip">Enero</a>
+            <a href="https://example.com/PLACSP_licitacionesPerfilesContratanteCompleto3_2020.zip">
+                2020</a>
+            <a href="/datos/otros_202101.zip">Otros</a>
+            <a href="/datos/PLACSP_leeme.txt">Leeme</a>
+            <a>Sin enlace</a>
+        </body></html>"""
+        session = Mock()
+        session.get.return_value = Mock(content=listing)
+
+        zips = ZipOrchestrator(session=session).discover_zips_from_url("https://example.com/")
+
+        assert [z.url for z in zips] == [
+            "https://example.com/datos/PLACSP_licitacionesPerfilesContratanteCompleto3_202101.zip",
+            "https://example.com/PLACSP_licitacionesPerfilesContratanteCompleto3_2020.zip",
+        ]
+        assert zips[0].date == datetime(2021, 1, 1)
+        assert zips[0].syndication_id == "3"
+
+    def test_fetch_and_prepare_zip_spools_download(self):
+        """Test fetched ZIPs are spooled to a file object usable by the ZIP handler."""
+        zip_buffer = BytesIO()
+        with ZipFile(zip_buffer, "w") as zf:
+            zf.writestr(
+                "licitacionesPerfilesContratanteCompleto3.atom", SAMPLE_ATOM_FEED.encode("utf-8")
+            )
+        zip_bytes = zip_buffer.getvalue()
+
+        mock_response = Mock()
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_response.iter_content.return_value = [zip_bytes[:100], zip_bytes[100:]]
+        session = Mock()
+        session.get.return_value = mock_response
+
+        orchestrator = ZipOrchestrator(session=session)
+        # Force a rollover to disk to cover the large-archive path
+        orchestrator.SPOOL_MAX_SIZE = 64
+        zip_info = PlacspZipInfo(filename="test.zip", url="http://example.com/test.zip")
+
+        zip_file, base_atom = orchestrator.fetch_and_prepare_zip(zip_info)
+        with zip_file:
+            feed = AtomZipHandler().extract_atom_from_zip(zip_file, base_atom)
+
+        assert base_atom == "licitacionesPerfilesContratanteCompleto3.atom"
+        assert feed.entries[0].entry_id == "urn:uuid:1234-5678"
+        assert session.get.call_args.kwargs["stream"] is True
+
+    def test_fetch_and_prepare_zip_uses_range_requests(self):
+        """Test only the central directory and base ATOM are fetched when ranges are supported."""
+        zip_buffer = BytesIO()
+        with ZipFile(zip_buffer, "w") as zf:
+            # Large stored member ahead of the base ATOM that should never be fetched
+            zf.writestr(
+                "licitacionesPerfilesContratanteCompleto3_20210101.atom", bytes(range(256)) * 8192
+            )
+            zf.writestr(
+                "licitacionesPerfilesContratanteCompleto3.atom", SAMPLE_ATOM_FEED.encode("utf-8")
+            )
+        zip_bytes = zip_buffer.getvalue()
+        fetched = []
+
+        def ranged_get(url, headers=None, timeout=None, stream=None):
+            start, end = headers["Range"].removeprefix("bytes=").split("-")
+            if not start:
+                start, end = max(0, len(zip_bytes) - int(end)), len(zip_bytes) - 1
+            start, end = int(start), int(end)
+            body = zip_bytes[start:end + 1]
+            fetched.append(body)
+            # Send a few bytes past the range to check they are ignored
+            response = Mock(
+                status_code=206,
+                headers={"Content-Range": f"bytes {start}-{end}/{len(zip_bytes)}"},
+                content=body,
+            )
+            response.iter_content.return_value = [body[:100], body[100:] + b"junk"]
+            response.__enter__ = Mock(return_value=response)
+            response.__exit__ = Mock(return_value=False)
+            return response
+
+        session = Mock()
+        session.get.side_effect = ranged_get
+
+        orchestrator = ZipOrchestrator(session=session)
+        zip_info = PlacspZipInfo(filename="test.zip", url="http://example.com/test.zip")
+
+        zip_file, base_atom = orchestrator.fetch_and_prepare_zip(zip_info)
+        with zip_file:
+            feed = AtomZipHandler().extract_atom_from_zip(zip_file, base_atom)
+
+        assert base_atom == "licitacionesPerfilesContratanteCompleto3.atom"
+        assert feed.entries[0].entry_id == "urn:uuid:1234-5678"
+        assert sum(map(len, fetched)) < len(zip_bytes) // 4
+        assert session.get.call_count == 2
+        session.head.assert_not_called()
+
     def test_processing_order(self):
         """Test getting correct processing order."""
         orchestrator = ZipOrchestrator()
@@ -9,6 +9,7 @@ This module contains shared tools and helpers used by different crawler implemen
 """
 
 from .atom_parser import (
+    AtomParser,
     AtomZipHandler,
     SyndicationChainFollower,
     AtomParseError,
@@ -31,6 +32,7 @@ from .concurrent_processor import (
 )
 
 __all__ = [
+    "AtomParser",
     "AtomZipHandler",
     "SyndicationChainFollower",
     "AtomParseError",
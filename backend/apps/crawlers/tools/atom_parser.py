@@ -6,28 +6,66 @@ references the next one chronologically. This allows processing
 of complete historical data while maintaining temporal order.
 """
 import logging
-import xml.etree.ElementTree as ET
+import threading
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Optional
-from urllib.parse import urljoin, urlparse
-from zipfile import ZipFile
+from typing import BinaryIO, Iterator, Optional, Union
+from urllib.parse import urljoin
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
 import requests
+from lxml import etree
 
+# lxml parsers are not thread-safe, so each worker thread keeps its own
+_TLS = threading.local()
 
-@dataclass
+
+def _open_zip(zip_content: Union[bytes, BinaryIO]) -> ZipFile:
+    """
+    Open a ZIP given as raw bytes or as a seekable binary file object.
+
+    A file object (e.g. a download spooled to disk) is read in place: only
+    the central directory and the requested members are touched, and the
+    caller stays responsible for closing it.
+    """
+    if isinstance(zip_content, bytes):
+        zip_content = BytesIO(zip_content)
+    return ZipFile(zip_content)
+
+
+def _get_parser() -> etree.XMLParser:
+    """Return the ATOM feed parser cached for the current thread."""
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = etree.XMLParser(
+            huge_tree=True,
+            remove_blank_text=True,
+            collect_ids=False,
+            resolve_entities=False,
+        )
+    return parser
+
+
+@dataclass(slots=True)
 class AtomEntry:
     """Represents a single entry in an ATOM feed."""
 
     entry_id: str
     title: str
     updated: Optional[str] = None
-    content: Optional[str] = None
-    raw_element: Optional[ET.Element] = None
+    content_text: Optional[str] = None  # Text content, or embedded XML once serialized
+    content_element: Optional[etree._Element] = None  # Embedded XML content root
+    raw_element: Optional[etree._Element] = None
+
+    @property
+    def content(self) -> Optional[str]:
+        """Entry content as a string; embedded XML is serialized on first access."""
+        if self.content_text is None and self.content_element is not None:
+            self.content_text = etree.tostring(self.content_element, encoding="unicode")
+        return self.content_text
 
 
-@dataclass
+@dataclass(slots=True)
 class AtomFeed:
     """Represents an ATOM feed with metadata and entries."""
 
@@ -48,6 +86,22 @@ class AtomNamespaces:
     CODICE = "http://www.plataforma.es/codice"
 
 
+# Fully-qualified (Clark notation) ATOM tags, so lookups skip prefix resolution
+_TAG_ID = f"{{{AtomNamespaces.ATOM}}}id"
+_TAG_TITLE = f"{{{AtomNamespaces.ATOM}}}title"
+_TAG_UPDATED = f"{{{AtomNamespaces.ATOM}}}updated"
+_TAG_CONTENT = f"{{{AtomNamespaces.ATOM}}}content"
+_TAG_LINK = f"{{{AtomNamespaces.ATOM}}}link"
+_TAG_ENTRY = f"{{{AtomNamespaces.ATOM}}}entry"
+
+
+def _element_text(elem: Optional[etree._Element]) -> Optional[str]:
+    """Return the stripped text of an element, or None if missing or empty."""
+    if elem is not None and elem.text:
+        return elem.text.strip()
+    return None
+
+
 class AtomParseError(Exception):
     """Exception raised during ATOM parsing."""
 
@@ -65,25 +119,28 @@ class AtomParser:
     - Handling both inline content and references
     """
 
+    # Namespaces for XPath queries (shared by every instance)
+    ns = {
+        "atom": AtomNamespaces.ATOM,
+        "xhtml": AtomNamespaces.XHTML,
+        "pcsp": AtomNamespaces.PCSP,
+        "codice": AtomNamespaces.CODICE,
+    }
+
     def __init__(self, session: Optional[requests.Session] = None, logger: Optional[logging.Logger] = None):
         """
         Initialize ATOM parser.
 
+        The parser is stateless apart from its logger, so one instance can be
+        shared across handlers; no HTTP session is created on its behalf.
+
         Args:
             session: Optional requests.Session for HTTP requests
             logger: Optional logger instance
         """
-        self.session = session or requests.Session()
+        self.session = session
         self.logger = logger or logging.getLogger(__name__)
 
-        # Namespaces for XPath queries
-        self.ns = {
-            "atom": AtomNamespaces.ATOM,
-            "xhtml": AtomNamespaces.XHTML,
-            "pcsp": AtomNamespaces.PCSP,
-            "codice": AtomNamespaces.CODICE,
-        }
-
     def parse_atom_bytes(self, xml_content: bytes, source_file: Optional[str] = None) -> AtomFeed:
         """
         Parse ATOM feed from bytes.
@@ -99,13 +156,40 @@ class AtomParser:
             AtomParseError: If parsing fails
         """
         try:
-            root = ET.fromstring(xml_content)
+            root = etree.fromstring(xml_content, parser=_get_parser())
             return self._parse_feed_root(root, source_file=source_file)
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             raise AtomParseError(f"Failed to parse XML: {e}")
         except Exception as e:
             raise AtomParseError(f"Unexpected error parsing ATOM: {e}")
 
+    def parse_atom_fileobj(self, fileobj: BinaryIO, source_file: Optional[str] = None) -> AtomFeed:
+        """
+        Parse ATOM feed from a binary file-like object.
+
+        lxml reads the stream incrementally, so no intermediate copy of the
+        document bytes is kept (e.g. when reading straight from a ZIP member).
+
+        Args:
+            fileobj: Readable binary stream with the feed XML
+            source_file: Optional filename for reference
+
+        Returns:
+            AtomFeed object with entries and metadata
+
+        Raises:
+            AtomParseError: If parsing fails
+        """
+        try:
+            root = etree.parse(fileobj, parser=_get_parser()).getroot()
+            return self._parse_feed_root(root, source_file=source_file)
+        except etree.XMLSyntaxError as e:
+            raise AtomParseError(f"Failed to parse XML: {e}")
+        except AtomParseError:
+            raise
+        except Exception as e:
+            raise AtomParseError(f"Unexpected error parsing ATOM: {e}")
+
     def parse_atom_file(self, file_path: str) -> AtomFeed:
         """
         Parse ATOM feed from file path.
@@ -126,7 +210,7 @@ class AtomParser:
         except IOError as e:
             raise AtomParseError(f"Failed to read ATOM file: {e}")
 
-    def _parse_feed_root(self, root: ET.Element, source_file: Optional[str] = None) -> AtomFeed:
+    def _parse_feed_root(self, root: etree._Element, source_file: Optional[str] = None) -> AtomFeed:
         """
         Parse the root feed element.
 
@@ -141,16 +225,16 @@ class AtomParser:
             AtomParseError: If feed structure is invalid
         """
         # Get feed metadata
-        feed_id = self._get_text(root, "atom:id")
-        title = self._get_text(root, "atom:title")
-        updated = self._get_text(root, "atom:updated")
+        feed_id = _element_text(root.find(_TAG_ID))
+        title = _element_text(root.find(_TAG_TITLE))
+        updated = _element_text(root.find(_TAG_UPDATED))
 
         if not feed_id:
             raise AtomParseError("Feed missing required 'id' element")
 
         # Parse all entries
         entries = []
-        for entry_elem in root.findall("atom:entry", self.ns):
+        for entry_elem in root.iterchildren(_TAG_ENTRY):
             try:
                 entry = self._parse_entry(entry_elem)
                 entries.append(entry)
@@ -173,7 +257,7 @@ class AtomParser:
         self.logger.debug(f"Parsed ATOM feed: {feed_id} with {len(entries)} entries")
         return feed
 
-    def _parse_entry(self, entry_elem: ET.Element) -> AtomEntry:
+    def _parse_entry(self, entry_elem: etree._Element) -> AtomEntry:
         """
         Parse a single ATOM entry.
 
@@ -186,35 +270,42 @@ class AtomParser:
         Raises:
             Exception: If required fields are missing
         """
-        entry_id = self._get_text(entry_elem, "atom:id")
-        title = self._get_text(entry_elem, "atom:title")
+        # One pass over the children instead of a find() per field;
+        # the first occurrence of each tag wins, as with find()
+        children: dict = {}
+        for child in entry_elem:
+            children.setdefault(child.tag, child)
+
+        entry_id = _element_text(children.get(_TAG_ID))
+        title = _element_text(children.get(_TAG_TITLE))
 
         if not entry_id or not title:
             raise ValueError("Entry missing 'id' or 'title'")
 
         # Extract content (may be embedded XML or text)
-        content_elem = entry_elem.find("atom:content", self.ns)
-        content = None
+        content_elem = children.get(_TAG_CONTENT)
+        content_text = None
+        content_element = None
         if content_elem is not None:
-            # Content can be text or embedded XML
+            # Content can be text or embedded XML; embedded XML is kept as an
+            # element and only serialized if AtomEntry.content is read
             if content_elem.text:
-                content = content_elem.text
-            else:
-                # Check for embedded XML elements
-                if len(content_elem) > 0:
-                    content = ET.tostring(content_elem[0], encoding="unicode")
+                content_text = content_elem.text
+            elif len(content_elem) > 0:
+                content_element = content_elem[0]
 
-        updated = self._get_text(entry_elem, "atom:updated")
+        updated = _element_text(children.get(_TAG_UPDATED))
 
         return AtomEntry(
             entry_id=entry_id,
             title=title,
             updated=updated,
-            content=content,
+            content_text=content_text,
+            content_element=content_element,
             raw_element=entry_elem,
         )
 
-    def _find_next_url(self, root: ET.Element) -> Optional[str]:
+    def _find_next_url(self, root: etree._Element) -> Optional[str]:
         """
         Find the link to the previous ATOM feed in the syndication chain.
 
@@ -227,7 +318,7 @@ class AtomParser:
         Returns:
             URL of next feed to process, or None if at end of chain
         """
-        for link_elem in root.findall("atom:link", self.ns):
+        for link_elem in root.iterchildren(_TAG_LINK):
             rel = link_elem.get("rel", "")
             href = link_elem.get("href")
 
@@ -236,7 +327,9 @@ class AtomParser:
 
         return None
 
-    def _get_text(self, elem: ET.Element, tag: str, default: Optional[str] = None) -> Optional[str]:
+    def _get_text(
+        self, elem: etree._Element, tag: str, default: Optional[str] = None
+    ) -> Optional[str]:
         """
         Get text content from element by tag name.
 
@@ -255,7 +348,7 @@ class AtomParser:
             return found.text.strip()
         return default
 
-    def extract_namespaced_text(self, elem: ET.Element, namespaced_tag: str) -> Optional[str]:
+    def extract_namespaced_text(self, elem: etree._Element, namespaced_tag: str) -> Optional[str]:
         """
         Extract text from a namespaced element.
 
@@ -279,24 +372,32 @@ class AtomZipHandler:
     - Multiple ZIPs should be processed in chronological order
     """
 
-    def __init__(self, session: Optional[requests.Session] = None, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        logger: Optional[logging.Logger] = None,
+        parser: Optional[AtomParser] = None,
+    ):
         """
         Initialize ZIP handler.
 
         Args:
             session: Optional requests.Session
             logger: Optional logger instance
+            parser: Optional AtomParser to share with other handlers
         """
         self.session = session or requests.Session()
         self.logger = logger or logging.getLogger(__name__)
-        self.parser = AtomParser(session=session, logger=logger)
+        self.parser = parser or AtomParser(session=session, logger=logger)
 
-    def extract_atom_from_zip(self, zip_content: bytes, atom_filename: Optional[str] = None) -> Optional[AtomFeed]:
+    def extract_atom_from_zip(
+        self, zip_content: Union[bytes, BinaryIO], atom_filename: Optional[str] = None
+    ) -> Optional[AtomFeed]:
         """
         Extract and parse ATOM feed from ZIP file.
 
         Args:
-            zip_content: Raw ZIP file bytes
+            zip_content: Raw ZIP file bytes or a seekable binary file object
             atom_filename: Specific ATOM filename to extract (optional)
 
         Returns:
@@ -306,29 +407,76 @@ class AtomZipHandler:
             AtomParseError: If ZIP or ATOM parsing fails
         """
         try:
-            with ZipFile(BytesIO(zip_content)) as zf:
-                # If filename not specified, look for .atom file
-                if not atom_filename:
-                    atom_files = [name for name in zf.namelist() if name.endswith(".atom")]
-                    if not atom_files:
-                        raise AtomParseError("No .atom file found in ZIP")
-                    atom_filename = atom_files[0]
+            with _open_zip(zip_content) as zf:
+                atom_info = self._find_atom_member(zf, atom_filename)
 
-                if atom_filename not in zf.namelist():
-                    raise AtomParseError(f"ATOM file not found: {atom_filename}")
+                # Parse straight from the decompression stream
+                with zf.open(atom_info) as atom_stream:
+                    return self.parser.parse_atom_fileobj(
+                        atom_stream, source_file=atom_info.filename
+                    )
 
-                atom_content = zf.read(atom_filename)
-                return self.parser.parse_atom_bytes(atom_content, source_file=atom_filename)
-
-        except ZipFile.BadZipFile as e:
+        except BadZipFile as e:
             raise AtomParseError(f"Invalid ZIP file: {e}")
         except Exception as e:
             raise AtomParseError(f"Failed to extract ATOM from ZIP: {e}")
 
+    def _find_atom_member(self, zf: ZipFile, atom_filename: Optional[str] = None) -> ZipInfo:
+        """
+        Locate the ATOM member to parse inside an open ZIP.
+
+        Args:
+            zf: Open ZipFile
+            atom_filename: Specific ATOM filename (optional, defaults to the first .atom file)
+
+        Returns:
+            ZipInfo of the ATOM member
+
+        Raises:
+            AtomParseError: If no matching ATOM file exists
+        """
+        # If filename not specified, look for .atom file
+        if not atom_filename:
+            atom_info = next(
+                (info for info in zf.infolist() if info.filename.endswith(".atom")), None
+            )
+            if atom_info is None:
+                raise AtomParseError("No .atom file found in ZIP")
+            return atom_info
+
+        try:
+            return zf.getinfo(atom_filename)
+        except KeyError:
+            raise AtomParseError(f"ATOM file not found: {atom_filename}")
+
+    def open_xml_files_from_zip(self, zip_content: bytes) -> "ZipXmlMembers":
+        """
+        Open a ZIP for lazy access to its XML/ATOM members.
+
+        Only the central directory is read up front; a member is decompressed
+        when it is explicitly read. Use as a context manager.
+
+        Args:
+            zip_content: Raw ZIP file bytes
+
+        Returns:
+            ZipXmlMembers accessor
+
+        Raises:
+            AtomParseError: If the ZIP is invalid
+        """
+        try:
+            return ZipXmlMembers(ZipFile(BytesIO(zip_content)))
+        except BadZipFile as e:
+            raise AtomParseError(f"Invalid ZIP file: {e}")
+
     def get_all_xml_files_from_zip(self, zip_content: bytes) -> dict[str, bytes]:
         """
         Extract all XML/ATOM files from ZIP.
 
+        Decompresses every member; prefer open_xml_files_from_zip when only
+        some of them are needed.
+
         Args:
             zip_content: Raw ZIP file bytes
 
@@ -337,16 +485,60 @@ class AtomZipHandler:
         """
         xml_files = {}
         try:
-            with ZipFile(BytesIO(zip_content)) as zf:
-                for name in zf.namelist():
-                    if name.endswith((".xml", ".atom")):
-                        xml_files[name] = zf.read(name)
+            with self.open_xml_files_from_zip(zip_content) as members:
+                for name in members.names():
+                    xml_files[name] = members.read(name)
         except Exception as e:
             self.logger.error(f"Failed to extract XML files from ZIP: {e}")
 
         return xml_files
 
 
+class ZipXmlMembers:
+    """
+    Lazy accessor for the XML/ATOM members of an open ZIP file.
+
+    Listing uses the central directory only; member data is read and
+    decompressed on demand.
+    """
+
+    SUFFIXES = (".xml", ".atom")
+
+    def __init__(self, zf: ZipFile):
+        """
+        Initialize accessor.
+
+        Args:
+            zf: Open ZipFile (closed by close() / on context exit)
+        """
+        self.zf = zf
+
+    def names(self) -> list[str]:
+        """Return the XML/ATOM member names in archive order."""
+        return [name for name in self.zf.namelist() if name.endswith(self.SUFFIXES)]
+
+    def read(self, name: str) -> bytes:
+        """
+        Read and decompress a single member.
+
+        Raises:
+            KeyError: If the member does not exist
+        """
+        return self.zf.read(name)
+
+    def close(self):
+        """Close the underlying ZIP file."""
+        self.zf.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
 class SyndicationChainFollower:
     """
     Follows the syndication chain of ATOM feeds.
@@ -360,23 +552,32 @@ class SyndicationChainFollower:
     This follower manages that chain traversal.
     """
 
-    def __init__(self, session: Optional[requests.Session] = None, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        logger: Optional[logging.Logger] = None,
+        parser: Optional[AtomParser] = None,
+    ):
         """
         Initialize chain follower.
 
         Args:
             session: Optional requests.Session
             logger: Optional logger instance
+            parser: Optional AtomParser to share with other handlers
         """
         self.session = session or requests.Session()
         self.logger = logger or logging.getLogger(__name__)
-        self.parser = AtomParser(session=session, logger=logger)
+        self.parser = parser or AtomParser(session=session, logger=logger)
         self.visited_urls = set()
 
     def follow_chain(self, start_url: str, max_iterations: int = 100) -> list[AtomFeed]:
         """
         Follow the syndication chain from a starting URL.
 
+        Each feed is parsed straight from the HTTP response stream, so parsing
+        overlaps with the download and the body is never buffered in full.
+
         Args:
             start_url: URL to the most recent ATOM feed
             max_iterations: Maximum feeds to follow (prevent infinite loops)
@@ -387,7 +588,27 @@ class SyndicationChainFollower:
         Raises:
             AtomParseError: If fetching or parsing fails
         """
-        feeds = []
+        feeds = list(self.iter_chain(start_url, max_iterations))
+
+        # Return in chronological order (oldest to newest)
+        feeds.reverse()
+        self.logger.info(f"Followed {len(feeds)} feeds in chain")
+        return feeds
+
+    def iter_chain(self, start_url: str, max_iterations: int = 100) -> Iterator[AtomFeed]:
+        """
+        Yield the feeds of a syndication chain as they are fetched.
+
+        Feeds come in traversal order (newest to oldest), so callers can
+        start working on a feed while the next one is still downloading.
+
+        Args:
+            start_url: URL to the most recent ATOM feed
+            max_iterations: Maximum feeds to follow (prevent infinite loops)
+
+        Yields:
+            AtomFeed objects, newest first
+        """
         current_url: Optional[str] = start_url
         iteration = 0
 
@@ -405,39 +626,48 @@ class SyndicationChainFollower:
 
             try:
                 self.logger.debug(f"Fetching feed [{iteration}]: {current_url}")
-                response = self.session.get(current_url, timeout=30)
-                response.raise_for_status()
+                feed = self._fetch_feed(current_url)
+            except requests.RequestException as e:
+                self.logger.error(f"Failed to fetch feed at iteration {iteration}: {e}")
+                break
+            except AtomParseError as e:
+                self.logger.error(f"Failed to parse feed at iteration {iteration}: {e}")
+                break
 
-                feed = self.parser.parse_atom_bytes(response.content, source_file=current_url)
-                feeds.append(feed)
+            self.logger.info(f"Fetched feed: {feed.feed_id} with {len(feed.entries)} entries")
+            yield feed
 
-                self.logger.info(f"Fetched feed: {feed.feed_id} with {len(feed.entries)} entries")
+            # Get next URL in chain
+            next_url = feed.next_url
 
-                # Get next URL in chain
-                next_url = feed.next_url
+            if not next_url:
+                # No more feeds in chain
+                break
 
-                if not next_url:
-                    # No more feeds in chain
-                    break
+            current_url = urljoin(current_url, next_url)
 
-                # Handle relative URLs
-                if not next_url.startswith("http"):
-                    base = urlparse(current_url)
-                    next_url = f"{base.scheme}://{base.netloc}{next_url}"
+    def _fetch_feed(self, url: str) -> AtomFeed:
+        """
+        Download and parse a feed document as it streams in.
 
-                current_url = next_url
+        Args:
+            url: Feed URL
 
-            except requests.RequestException as e:
-                self.logger.error(f"Failed to fetch feed at iteration {iteration}: {e}")
-                break
-            except AtomParseError as e:
-                self.logger.error(f"Failed to parse feed at iteration {iteration}: {e}")
-                break
+        Returns:
+            Parsed AtomFeed
 
-        # Return in chronological order (oldest to newest)
-        feeds.reverse()
-        self.logger.info(f"Followed {len(feeds)} feeds in chain")
-        return feeds
+        Raises:
+            requests.RequestException: If the request fails
+            AtomParseError: If the feed cannot be parsed
+        """
+        response = self.session.get(url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            # Let urllib3 undo gzip/deflate content encoding while lxml reads
+            response.raw.decode_content = True
+            return self.parser.parse_atom_fileobj(response.raw, source_file=url)
+        finally:
+            response.close()
 
     def reset(self):
         """Reset visited URLs tracking."""
@@ -6,18 +6,29 @@ to dramatically improve crawler performance while maintaining thread safety.
 """
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Callable, Optional
-from queue import Queue
+import random
 import time
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Failures kept in ProcessingStats.errors (oldest dropped first)
+MAX_ERROR_SAMPLES = 500
 
-@dataclass
+# Identifier attributes probed on processed items, in order of preference
+_ITEM_ID_ATTRS = ("filename", "entry_id", "id")
+
+# Identifier attribute found for each item type (None: no such attribute)
+_item_id_attr_by_type: dict[type, Optional[str]] = {}
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """Result from processing a single item."""
     
@@ -28,7 +39,7 @@ class ProcessingResult:
     duration: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics from concurrent processing."""
     
@@ -36,7 +47,8 @@ class ProcessingStats:
     successful: int = 0
     failed: int = 0
     total_duration: float = 0.0
-    errors: list = field(default_factory=list)
+    # Most recent failures only; ``failed`` keeps the true count
+    errors: deque = field(default_factory=lambda: deque(maxlen=MAX_ERROR_SAMPLES))
     
     @property
     def success_rate(self) -> float:
@@ -54,31 +66,48 @@ class ProcessingStats:
 
 
 class RateLimiter:
-    """Thread-safe rate limiter using token bucket algorithm."""
+    """
+    Thread-safe rate limiter using token bucket algorithm.
+
+    Tokens refill at ``requests_per_second`` up to ``burst``, so after an
+    idle gap up to ``burst`` callers proceed at once. A caller that finds the
+    bucket empty reserves the next token and sleeps outside the lock until it
+    is due, so waiting callers never hold up the others.
+    """
     
-    def __init__(self, requests_per_second: float = 5.0):
+    def __init__(self, requests_per_second: float = 5.0, burst: float = 1.0, jitter: float = 0.1):
         """
         Initialize rate limiter.
         
         Args:
             requests_per_second: Maximum requests per second
+            burst: Bucket capacity (requests allowed back-to-back after idling)
+            jitter: Extra random fraction added to each wait so that sleeping
+                workers do not all wake up together
         """
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0.0
+        self.capacity = max(float(burst), 1.0)
+        self.jitter = jitter
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
     
     def acquire(self):
         """Wait until a request can be made according to rate limit."""
         with self.lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.requests_per_second)
+            self.last_refill = now
             
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                time.sleep(wait_time)
-            
-            self.last_request_time = time.time()
+            # Take a token; a negative balance is a reservation on future refill
+            self.tokens -= 1.0
+            deficit = -self.tokens
+        
+        if deficit > 0:
+            wait_time = deficit * self.min_interval
+            time.sleep(wait_time * (1.0 + random.uniform(0.0, self.jitter)))
 
 
 class ConcurrentProcessor:
@@ -89,14 +118,17 @@ class ConcurrentProcessor:
     - Thread pool management
     - Connection pooling
     - Rate limiting
-    - Error collection
+    - Error collection (on the calling thread)
     - Progress tracking
     """
     
+    # Items submitted ahead per worker; bounds the number of live futures
+    in_flight_per_worker: int = 4
+    
     def __init__(
         self,
         max_workers: int = 8,
-        rate_limit: float = 5.0,
+        rate_limit: Optional[float] = 5.0,
         retry_attempts: int = 3,
         retry_backoff: float = 2.0,
         logger: Optional[logging.Logger] = None
@@ -106,21 +138,36 @@ class ConcurrentProcessor:
         
         Args:
             max_workers: Maximum number of concurrent threads
-            rate_limit: Maximum requests per second
+            rate_limit: Maximum requests per second (None disables rate limiting)
             retry_attempts: Number of retry attempts for failed requests
             retry_backoff: Backoff factor for retries
             logger: Optional logger instance
         """
         self.max_workers = max_workers
         self.logger = logger or logging.getLogger(__name__)
-        self.rate_limiter = RateLimiter(requests_per_second=rate_limit)
-        
-        # Create session with connection pooling and retries
-        self.session = self._create_session_with_retries(retry_attempts, retry_backoff)
+        self.rate_limiter = (
+            RateLimiter(requests_per_second=rate_limit, burst=max_workers)
+            if rate_limit is not None
+            else None
+        )
         
-        # Thread-safe error collection
-        self.errors = Queue()
-        self.error_lock = threading.Lock()
+        # Session with connection pooling and retries, built on first use so
+        # processors that only run local work never open one
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Shared pooled session, created on first access."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session_with_retries(
+                        self.retry_attempts, self.retry_backoff
+                    )
+        return self._session
     
     def _create_session_with_retries(
         self, 
@@ -168,20 +215,32 @@ class ConcurrentProcessor:
         self,
         items: list,
         process_func: Callable,
-        item_name: str = "item"
+        item_name: str = "item",
+        on_result: Optional[Callable[[Any], Any]] = None,
+        fail_fast: bool = False
     ) -> tuple[list, ProcessingStats]:
         """
         Process items concurrently using thread pool.
         
+        Workers only return ProcessingResult objects; results and errors are
+        collected on the calling thread, so no locking is needed for them.
+        
         Args:
             items: List of items to process
             process_func: Function to process each item (must be thread-safe)
             item_name: Name for logging (e.g., "ZIP", "entry")
+            on_result: Optional sink called with each non-empty result as it
+                completes; when given, results are not collected in the list
+            fail_fast: Stop at the first failed item: queued items are
+                cancelled, no new ones are submitted and results of items
+                already running are discarded
         
         Returns:
             Tuple of (results_list, processing_stats)
         """
         results = []
+        if on_result is None:
+            on_result = results.append
         stats = ProcessingStats(total_items=len(items))
         
         if not items:
@@ -189,45 +248,76 @@ class ConcurrentProcessor:
             return results, stats
         
         self.logger.info(f"Processing {len(items)} {item_name}s with {self.max_workers} workers")
-        start_time = time.time()
+        start_time = time.monotonic()
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all items for processing
+            # Per-item debug lines are skipped outright unless DEBUG is enabled
+            log_items = self.logger.isEnabledFor(logging.DEBUG)
+            
+            # Keep a bounded window of submitted items and refill it as work
+            # completes, instead of creating a future for every item up front
+            pending_items = iter(items)
+            window = self.max_workers * self.in_flight_per_worker
             future_to_item = {
                 executor.submit(self._process_with_rate_limit, process_func, item, item_name): item
-                for item in items
+                for item in islice(pending_items, window)
             }
             
             # Collect results as they complete
-            for future in as_completed(future_to_item):
-                item = future_to_item[future]
-                try:
-                    result = future.result()
-                    
-                    if result.success:
-                        stats.successful += 1
-                        if result.data:
-                            results.append(result.data)
-                        self.logger.debug(f"✓ {item_name} {result.item_id} processed in {result.duration:.2f}s")
-                    else:
+            while future_to_item:
+                done, _ = wait(future_to_item, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    item = future_to_item.pop(future)
+                    try:
+                        result = future.result()
+                        
+                        if result.success:
+                            stats.successful += 1
+                            if result.data:
+                                on_result(result.data)
+                            if log_items:
+                                self.logger.debug(
+                                    f"✓ {item_name} {result.item_id} processed in "
+                                    f"{result.duration:.2f}s"
+                                )
+                        else:
+                            stats.failed += 1
+                            stats.errors.append({
+                                'item_id': result.item_id,
+                                'error': str(result.error)
+                            })
+                            self.logger.warning(
+                                f"✗ {item_name} {result.item_id} failed: {result.error}"
+                            )
+                        
+                        stats.total_duration += result.duration
+                        
+                    except Exception as e:
                         stats.failed += 1
                         stats.errors.append({
-                            'item_id': result.item_id,
-                            'error': str(result.error)
+                            'item_id': str(item),
+                            'error': str(e)
                         })
-                        self.logger.warning(f"✗ {item_name} {result.item_id} failed: {result.error}")
-                    
-                    stats.total_duration += result.duration
-                    
-                except Exception as e:
-                    stats.failed += 1
-                    stats.errors.append({
-                        'item_id': str(item),
-                        'error': str(e)
-                    })
-                    self.logger.error(f"✗ Unexpected error processing {item_name}: {e}")
+                        self.logger.error(f"✗ Unexpected error processing {item_name}: {e}")
+                
+                if fail_fast and stats.failed:
+                    for future in future_to_item:
+                        future.cancel()
+                    skipped = stats.total_items - stats.successful - stats.failed
+                    self.logger.warning(
+                        f"Stopping after first failed {item_name}: "
+                        f"{skipped} {item_name}s skipped"
+                    )
+                    break
+                
+                for item in islice(pending_items, len(done)):
+                    future = executor.submit(
+                        self._process_with_rate_limit, process_func, item, item_name
+                    )
+                    future_to_item[future] = item
         
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         
         self.logger.info(
             f"Completed processing {len(items)} {item_name}s in {total_time:.2f}s: "
@@ -255,16 +345,17 @@ class ConcurrentProcessor:
             ProcessingResult
         """
         item_id = self._get_item_id(item)
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Apply rate limiting
-            self.rate_limiter.acquire()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             
             # Process item
             result_data = process_func(item)
             
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             return ProcessingResult(
                 item_id=item_id,
                 success=True,
@@ -273,7 +364,7 @@ class ConcurrentProcessor:
             )
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             self.logger.debug(f"Error processing {item_name} {item_id}: {e}")
             return ProcessingResult(
                 item_id=item_id,
@@ -283,22 +374,37 @@ class ConcurrentProcessor:
             )
     
     def _get_item_id(self, item: Any) -> str:
-        """Extract identifier from item for logging."""
-        if hasattr(item, 'filename'):
-            return item.filename
-        elif hasattr(item, 'entry_id'):
-            return item.entry_id
-        elif hasattr(item, 'id'):
-            return str(item.id)
-        elif isinstance(item, dict):
+        """
+        Extract identifier from item for logging.
+
+        The identifying attribute is probed once per item type and then read
+        directly, since a batch holds thousands of items of the same type.
+        """
+        item_type = type(item)
+        try:
+            attr = _item_id_attr_by_type[item_type]
+        except KeyError:
+            attr = next((name for name in _ITEM_ID_ATTRS if hasattr(item, name)), None)
+            _item_id_attr_by_type[item_type] = attr
+
+        if attr is not None:
+            try:
+                value = getattr(item, attr)
+            except AttributeError:
+                # Instance lacks the attribute its type usually has
+                pass
+            else:
+                return str(value) if attr == 'id' else value
+
+        if isinstance(item, dict):
             return item.get('id', item.get('filename', str(item)[:50]))
-        else:
-            return str(item)[:50]
+        return str(item)[:50]
     
     def cleanup(self):
         """Clean up resources."""
-        if hasattr(self, 'session'):
-            self.session.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -329,18 +435,15 @@ class ZipConcurrentProcessor(ConcurrentProcessor):
         """
         all_contracts = []
         
-        # Process ZIPs concurrently
-        zip_results, stats = self.process_items_concurrent(
+        # Process ZIPs concurrently, flattening each ZIP's contract list as
+        # soon as it completes
+        _, stats = self.process_items_concurrent(
             items=zips,
             process_func=process_zip_func,
-            item_name="ZIP"
+            item_name="ZIP",
+            on_result=all_contracts.extend
         )
         
-        # Flatten results (each ZIP returns a list of contracts)
-        for contracts in zip_results:
-            if contracts:
-                all_contracts.extend(contracts)
-        
         self.logger.info(f"Extracted {len(all_contracts)} total contracts from {stats.successful} ZIPs")
         
         return all_contracts, stats
@@ -6,13 +6,151 @@ OpenPLACSP manual specification. Handles both licitaciones (tenders) and
 resultados (awards) with multiple lots and adjudicatarios.
 """
 import logging
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field, asdict
-from decimal import Decimal
-from typing import Any, Optional
+import re
+import sys
+import threading
+from dataclasses import dataclass, field, fields
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+from lxml import etree
+
+# lxml parsers are not thread-safe, so each worker thread keeps its own
+_TLS = threading.local()
+
+
+def _get_parser() -> etree.XMLParser:
+    """Return the XML parser cached for the current thread."""
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        # Only element text is read, so skip whitespace nodes and the xml:id table
+        parser = _TLS.parser = etree.XMLParser(
+            remove_blank_text=True,
+            collect_ids=False,
+            resolve_entities=False,
+        )
+    return parser
+
+
+# Plain XML numbers ("100000.00") need no separator handling
+_PLAIN_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+# Values PLACSP uses for "yes" ("sí"/"si" in Spanish, xs:boolean otherwise)
+_TRUTHY = frozenset({"sí", "si", "true", "1"})
+
+
+def _parse_bool(text: str) -> bool:
+    """Parse a PLACSP yes/no flag."""
+    return text.casefold() in _TRUTHY
+
+
+def _intern_code(text: Optional[str]) -> Optional[str]:
+    """
+    Intern a code-list value (status, CPV, NUTS, procedure type...).
+
+    These come from small fixed vocabularies but are read as fresh strings
+    per entry, so a large crawl would otherwise hold millions of copies.
+    """
+    return sys.intern(text) if text else text
+
+
+@lru_cache(maxsize=4096)
+def _parse_money(text: str) -> Decimal:
+    """
+    Parse a money string to Decimal.
 
+    Handles both Spanish (1.234,56) and English (1,234.56) number formats;
+    plain numbers skip the separator checks entirely. Budgets repeat a lot
+    across a feed (round amounts, lots sharing a price), and Decimal is
+    immutable, so parsed values are cached by their source text.
 
-@dataclass
+    Raises:
+        decimal.InvalidOperation: If the text is not a number
+    """
+    cleaned = text.strip()
+    if _PLAIN_NUMBER.fullmatch(cleaned):
+        return Decimal(cleaned)
+
+    # If there's both comma and dot, determine which is decimal separator
+    if "," in cleaned and "." in cleaned:
+        if cleaned.rfind(",") > cleaned.rfind("."):
+            # Spanish format: 1.234,56 -> remove dots, replace comma with dot
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+        else:
+            # English format: 1,234.56 -> just remove commas
+            cleaned = cleaned.replace(",", "")
+    elif "," in cleaned:
+        # Only comma - assume it's decimal separator (Spanish)
+        cleaned = cleaned.replace(",", ".")
+
+    # If only dots, leave as is (could be thousands or decimal)
+    return Decimal(cleaned)
+
+
+@lru_cache(maxsize=None)
+def _pcsp_xpath(path: str) -> etree.XPath:
+    """Compile an XPath over the embedded pcsp: schema once and reuse it."""
+    return etree.XPath(path, namespaces=PlacspFieldsExtractor.NAMESPACES)
+
+
+@lru_cache(maxsize=None)
+def _codice_xpath(path: str) -> etree.XPath:
+    """Compile an XPath over the CODICE (ContractFolderStatus) schema once and reuse it."""
+    return etree.XPath(path, namespaces=PlacspFieldsExtractor.CODICE_NAMESPACES)
+
+
+@lru_cache(maxsize=None)
+def _codice_tag(path: str) -> Optional[str]:
+    """Clark-notation tag for a single-step CODICE path ("agg:TenderResult"), else None."""
+    prefix, sep, local = path.partition(":")
+    if not sep or not local.isidentifier():
+        return None
+    return f"{{{PlacspFieldsExtractor.CODICE_NAMESPACES[prefix]}}}{local}"
+
+
+def _codice_first(elem: etree._Element, path: str) -> Optional[etree._Element]:
+    """Return the first element matching a CODICE path, or None."""
+    tag = _codice_tag(path)
+    if tag is not None:
+        # Direct children: lazy C-level scan that stops at the first match
+        return next(elem.iterchildren(tag), None)
+    found = _codice_xpath(path)(elem)
+    return found[0] if found else None
+
+
+def _codice_children(elem: etree._Element, path: str) -> Iterator[etree._Element]:
+    """Iterate the direct children matching a single-step CODICE path."""
+    return elem.iterchildren(_codice_tag(path))
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a dataclass, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _to_json_dict(record: Any) -> dict[str, Any]:
+    """
+    Convert an extractor dataclass to a JSON-ready dict.
+
+    Decimals become floats (zero/empty ones None) and nested dataclass lists
+    are converted recursively. Unlike asdict(), values are not deep-copied:
+    everything else here is an immutable scalar.
+    """
+    data = {}
+    for name in _field_names(record.__class__):
+        value = getattr(record, name)
+        if value.__class__ is Decimal:
+            value = float(value) if value else None
+        elif value.__class__ is list:
+            value = [_to_json_dict(item) for item in value]
+        data[name] = value
+    return data
+
+
+@dataclass(slots=True)
 class ContractLot:
     """Represents a single lot in a contract."""
 
@@ -24,7 +162,7 @@ class ContractLot:
     execution_place: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AwardedCompany:
     """Represents an awarded company for a lot."""
 
@@ -36,7 +174,7 @@ class AwardedCompany:
     award_amount_with_taxes: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractResult:
     """Represents the result/award information for a lot."""
 
@@ -53,7 +191,7 @@ class ContractResult:
     awarded_companies: list[AwardedCompany] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlacspLicitacion:
     """
     Complete PLACSP licitacion (tender) with all fields from the manual.
@@ -118,19 +256,23 @@ class PlacspLicitacion:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, handling nested dataclasses and Decimals."""
-        result = {}
-        for key, value in asdict(self).items():
-            if isinstance(value, Decimal):
-                result[key] = float(value) if value else None
-            elif isinstance(value, list):
-                # Handle nested dataclasses
-                result[key] = [
-                    item.to_dict() if hasattr(item, "to_dict") else item for item in value
-                ]
-            else:
-                result[key] = value
-        return result
-
+        return _to_json_dict(self)
+
+
+# ContractFolderStatus child under any of the known CODICE namespace variants,
+# matched in a single pass over the entry's children
+_CONTRACT_FOLDER_NAMESPACES = (
+    "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2",
+    "urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2",
+    "http://www.plataforma.es/codice",
+    "http://contrataciondelestado.es/codice",
+)
+_CONTRACT_FOLDER_XPATH = etree.XPath(
+    "("
+    + "|".join(f"v{i}:ContractFolderStatus" for i in range(len(_CONTRACT_FOLDER_NAMESPACES)))
+    + ")[1]",
+    namespaces={f"v{i}": ns for i, ns in enumerate(_CONTRACT_FOLDER_NAMESPACES)},
+)
 
 class PlacspFieldsExtractor:
     """
@@ -147,6 +289,15 @@ class PlacspFieldsExtractor:
         "atom": "http://www.w3.org/2005/Atom",
     }
 
+    # Namespaces of the CODICE ContractFolderStatus entries
+    CODICE_NAMESPACES = {
+        "basic": "urn:dgpe:names:draft:codice:schema:xsd:CommonBasicComponents-2",
+        "ext_basic": "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonBasicComponents-2",
+        "agg": "urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2",
+        "ext_agg": "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2",
+        "atom": "http://www.w3.org/2005/Atom",
+    }
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize extractor."""
         self.logger = logger or logging.getLogger(__name__)
@@ -167,17 +318,44 @@ class PlacspFieldsExtractor:
             if not entry_xml:
                 return None
 
-            root = ET.fromstring(entry_xml)
+            if isinstance(entry_xml, str):
+                entry_xml = entry_xml.encode("utf-8")
+
+            root = etree.fromstring(entry_xml, parser=_get_parser())
             return self._extract_from_root(root, entry_id)
 
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             self.logger.warning(f"Failed to parse entry XML {entry_id}: {e}")
             return None
         except Exception as e:
             self.logger.error(f"Error extracting fields from {entry_id}: {e}")
             return None
 
-    def extract_from_atom_entry_element(self, entry_elem: ET.Element, entry_id: str) -> Optional[PlacspLicitacion]:
+    def extract_from_content_element(
+        self, content_elem: etree._Element, entry_id: str
+    ) -> Optional[PlacspLicitacion]:
+        """
+        Extract PLACSP fields from an already-parsed ATOM content element.
+
+        Equivalent to extract_from_atom_entry_xml on the serialized element,
+        without the serialize/re-parse round trip.
+
+        Args:
+            content_elem: Embedded XML root from atom:content
+            entry_id: ATOM entry ID for reference
+
+        Returns:
+            PlacspLicitacion object or None if extraction fails
+        """
+        try:
+            return self._extract_from_root(content_elem, entry_id)
+        except Exception as e:
+            self.logger.error(f"Error extracting fields from {entry_id}: {e}")
+            return None
+
+    def extract_from_atom_entry_element(
+        self, entry_elem: etree._Element, entry_id: str
+    ) -> Optional[PlacspLicitacion]:
         """
         Extract PLACSP fields from ATOM entry CODICE XML element.
 
@@ -212,10 +390,12 @@ class PlacspFieldsExtractor:
             # Don't give up - try text-based extraction as last resort
             try:
                 return self._extract_from_summary_fallback(entry_elem, entry_id)
-            except:
+            except Exception:
                 return None
     
-    def _find_contract_folder_with_fallbacks(self, entry_elem: ET.Element) -> Optional[ET.Element]:
+    def _find_contract_folder_with_fallbacks(
+        self, entry_elem: etree._Element
+    ) -> Optional[etree._Element]:
         """
         Find ContractFolderStatus element trying multiple namespace variants.
         
@@ -226,27 +406,22 @@ class PlacspFieldsExtractor:
             ContractFolderStatus element or None
         """
         # Try all known namespace variations
-        namespace_variants = [
-            "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2",
-            "urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2",
-            "http://www.plataforma.es/codice",
-            "http://contrataciondelestado.es/codice",
-        ]
-        
-        for ns in namespace_variants:
-            contract_folder = entry_elem.find(f"{{{ns}}}ContractFolderStatus")
-            if contract_folder is not None:
-                return contract_folder
+        found = _CONTRACT_FOLDER_XPATH(entry_elem)
+        if found:
+            return found[0]
         
         # Try without namespace (lenient mode)
         for elem in entry_elem.iter():
-            if elem.tag.endswith('ContractFolderStatus'):
+            # lxml yields comments/PIs whose tag is not a string
+            if isinstance(elem.tag, str) and elem.tag.endswith('ContractFolderStatus'):
                 self.logger.debug(f"Found ContractFolderStatus with tag: {elem.tag}")
                 return elem
         
         return None
     
-    def _extract_from_summary_fallback(self, entry_elem: ET.Element, entry_id: str) -> Optional[PlacspLicitacion]:
+    def _extract_from_summary_fallback(
+        self, entry_elem: etree._Element, entry_id: str
+    ) -> Optional[PlacspLicitacion]:
         """
         Extract basic contract info from ATOM summary/title when XML parsing fails.
         
@@ -274,6 +449,8 @@ class PlacspFieldsExtractor:
                 else:
                     # Try without namespace
                     for elem in entry_elem.iter():
+                        if not isinstance(elem.tag, str):
+                            continue
                         if elem.tag.endswith('title'):
                             title_elem = elem
                         if elem.tag.endswith('summary'):
@@ -298,7 +475,9 @@ class PlacspFieldsExtractor:
             self.logger.debug(f"Summary fallback extraction failed for {entry_id}: {e}")
             return None
 
-    def _extract_from_codice(self, contract_folder: ET.Element, entry_id: str, entry_elem: ET.Element) -> Optional[PlacspLicitacion]:
+    def _extract_from_codice(
+        self, contract_folder: etree._Element, entry_id: str, entry_elem: etree._Element
+    ) -> Optional[PlacspLicitacion]:
         """
         Extract from CODICE ContractFolderStatus element.
 
@@ -316,56 +495,47 @@ class PlacspFieldsExtractor:
             update_date="",
         )
 
-        # CODICE namespaces
-        ns = {
-            "basic": "urn:dgpe:names:draft:codice:schema:xsd:CommonBasicComponents-2",
-            "ext_basic": "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonBasicComponents-2",
-            "agg": "urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2",
-            "ext_agg": "urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2",
-            "atom": "http://www.w3.org/2005/Atom",
-        }
-
         # Extract ID and status from ContractFolder
-        contract_id = self._get_text_codice(contract_folder, f"{{{ns['basic']}}}ContractFolderID")
+        contract_id = self._get_text_codice(contract_folder, "basic:ContractFolderID")
         if contract_id:
             licitacion.expedition_number = contract_id
 
-        status_code = self._get_text_codice(contract_folder, f"{{{ns['ext_basic']}}}ContractFolderStatusCode")
+        status_code = self._get_text_codice(contract_folder, "ext_basic:ContractFolderStatusCode")
         if status_code:
-            licitacion.status = status_code
+            licitacion.status = _intern_code(status_code)
 
         # Get title from ATOM entry
-        atom_title = entry_elem.find(f"{{{ns['atom']}}}title")
+        atom_title = _codice_first(entry_elem, "atom:title")
         if atom_title is not None and atom_title.text:
             licitacion.contract_object = atom_title.text.strip()
 
         # Get summary from ATOM entry
-        atom_summary = entry_elem.find(f"{{{ns['atom']}}}summary")
+        atom_summary = _codice_first(entry_elem, "atom:summary")
         if atom_summary is not None and atom_summary.text:
             # Parse summary to extract key fields
             summary_text = atom_summary.text
             self._extract_from_summary(summary_text, licitacion)
 
         # Extract authority (LocatedContractingParty)
-        contracting_party = contract_folder.find(f"{{{ns['ext_agg']}}}LocatedContractingParty")
+        contracting_party = _codice_first(contract_folder, "ext_agg:LocatedContractingParty")
         if contracting_party is not None:
-            self._extract_authority_from_codice(contracting_party, licitacion, ns)
+            self._extract_authority_from_codice(contracting_party, licitacion)
 
         # Extract procurement project details
-        project = contract_folder.find(f"{{{ns['agg']}}}ProcurementProject")
+        project = _codice_first(contract_folder, "agg:ProcurementProject")
         if project is not None:
-            self._extract_project_from_codice(project, licitacion, ns)
+            self._extract_project_from_codice(project, licitacion)
 
         # Extract lots
-        licitacion.lots = self._extract_lots_from_codice(contract_folder, ns)
+        licitacion.lots = self._extract_lots_from_codice(contract_folder)
 
         # Extract tendering process
-        tendering = contract_folder.find(f"{{{ns['agg']}}}TenderingProcess")
+        tendering = _codice_first(contract_folder, "agg:TenderingProcess")
         if tendering is not None:
-            self._extract_tendering_from_codice(tendering, licitacion, ns)
+            self._extract_tendering_from_codice(tendering, licitacion)
 
         # Extract results/awards
-        licitacion.results = self._extract_results_from_codice(contract_folder, ns)
+        licitacion.results = self._extract_results_from_codice(contract_folder)
 
         return licitacion
 
@@ -390,23 +560,25 @@ class PlacspFieldsExtractor:
         if "importe" in parts:
             amount_str = parts["importe"].split()[0]  # Remove "EUR" or other currency
             try:
-                licitacion.budget_without_taxes = Decimal(amount_str.replace(".", "").replace(",", "."))
-            except:
+                licitacion.budget_without_taxes = _parse_money(amount_str)
+            except InvalidOperation:
                 pass
 
         if "estado" in parts:
             licitacion.status = parts["estado"]
 
-    def _extract_authority_from_codice(self, party_elem: ET.Element, licitacion: PlacspLicitacion, ns: dict):
+    def _extract_authority_from_codice(
+        self, party_elem: etree._Element, licitacion: PlacspLicitacion
+    ):
         """Extract authority information from CODICE structure."""
-        party = party_elem.find(f"{{{ns['agg']}}}Party")
+        party = _codice_first(party_elem, "agg:Party")
         if party is None:
             return
 
-        licitacion.contracting_authority = self._get_text_codice(party, f"{{{ns['agg']}}}PartyName/{{{ns['basic']}}}Name")
+        licitacion.contracting_authority = self._get_text_codice(party, "agg:PartyName/basic:Name")
 
         # Extract identifiers
-        for id_elem in party.findall(f"{{{ns['agg']}}}PartyIdentification/{{{ns['basic']}}}ID"):
+        for id_elem in _codice_xpath("agg:PartyIdentification/basic:ID")(party):
             scheme = id_elem.get("schemeName", "")
             if scheme == "DIR3":
                 licitacion.authority_dir3 = id_elem.text
@@ -414,159 +586,166 @@ class PlacspFieldsExtractor:
                 licitacion.authority_tax_id = id_elem.text
 
         # Extract contact
-        contact = party.find(f"{{{ns['agg']}}}Contact")
+        contact = _codice_first(party, "agg:Contact")
         if contact is not None:
-            phone = contact.find(f"{{{ns['basic']}}}Telephone")
+            phone = _codice_first(contact, "basic:Telephone")
             if phone is not None and phone.text:
                 licitacion.authority_profile_link = phone.text  # Reuse field for contact info
 
-    def _extract_project_from_codice(self, project_elem: ET.Element, licitacion: PlacspLicitacion, ns: dict):
+    def _extract_project_from_codice(
+        self, project_elem: etree._Element, licitacion: PlacspLicitacion
+    ):
         """Extract procurement project details from CODICE."""
-        name = self._get_text_codice(project_elem, f"{{{ns['basic']}}}Name")
+        name = self._get_text_codice(project_elem, "basic:Name")
         if name:
             licitacion.contract_object = name
 
         # Type code
-        type_code = project_elem.find(f"{{{ns['basic']}}}TypeCode")
+        type_code = _codice_first(project_elem, "basic:TypeCode")
         if type_code is not None:
-            licitacion.contract_type = type_code.text
+            licitacion.contract_type = _intern_code(type_code.text)
 
         # Budget
-        budget = project_elem.find(f"{{{ns['agg']}}}BudgetAmount")
+        budget = _codice_first(project_elem, "agg:BudgetAmount")
         if budget is not None:
-            estimated = self._get_decimal_codice(budget, f"{{{ns['basic']}}}EstimatedOverallContractAmount")
+            estimated = self._get_decimal_codice(budget, "basic:EstimatedOverallContractAmount")
             if estimated:
                 licitacion.budget_without_taxes = estimated
 
-            total = self._get_decimal_codice(budget, f"{{{ns['basic']}}}TotalAmount")
+            total = self._get_decimal_codice(budget, "basic:TotalAmount")
             if total:
                 licitacion.budget_with_taxes = total
 
         # CPV
-        cpv = project_elem.find(f"{{{ns['agg']}}}RequiredCommodityClassification/{{{ns['basic']}}}ItemClassificationCode")
+        cpv = _codice_first(
+            project_elem, "agg:RequiredCommodityClassification/basic:ItemClassificationCode"
+        )
         if cpv is not None and cpv.text:
-            licitacion.cpv_code = cpv.text
+            licitacion.cpv_code = _intern_code(cpv.text)
 
         # Location
-        location = project_elem.find(f"{{{ns['agg']}}}RealizedLocation")
+        location = _codice_first(project_elem, "agg:RealizedLocation")
         if location is not None:
-            subentity = self._get_text_codice(location, f"{{{ns['basic']}}}CountrySubentity")
+            subentity = self._get_text_codice(location, "basic:CountrySubentity")
             if subentity:
                 licitacion.execution_place_name = subentity
 
-            code = location.find(f"{{{ns['basic']}}}CountrySubentityCode")
+            code = _codice_first(location, "basic:CountrySubentityCode")
             if code is not None and code.text:
-                licitacion.execution_place_nuts = code.text
+                licitacion.execution_place_nuts = _intern_code(code.text)
 
-    def _extract_lots_from_codice(self, contract_folder: ET.Element, ns: dict) -> list[ContractLot]:
+    def _extract_lots_from_codice(self, contract_folder: etree._Element) -> list[ContractLot]:
         """Extract lots from CODICE structure."""
         lots = []
-        for lot_elem in contract_folder.findall(f"{{{ns['agg']}}}ProcurementProjectLot"):
+        for lot_elem in _codice_children(contract_folder, "agg:ProcurementProjectLot"):
             lot = ContractLot()
 
-            lot_id = lot_elem.find(f"{{{ns['basic']}}}ID")
+            lot_id = _codice_first(lot_elem, "basic:ID")
             if lot_id is not None:
                 lot.lot_number = lot_id.text
 
-            project = lot_elem.find(f"{{{ns['agg']}}}ProcurementProject")
+            project = _codice_first(lot_elem, "agg:ProcurementProject")
             if project is not None:
-                lot.object = self._get_text_codice(project, f"{{{ns['basic']}}}Name")
+                lot.object = self._get_text_codice(project, "basic:Name")
 
-                budget = project.find(f"{{{ns['agg']}}}BudgetAmount")
+                budget = _codice_first(project, "agg:BudgetAmount")
                 if budget is not None:
-                    lot.budget_without_taxes = self._get_decimal_codice(budget, f"{{{ns['basic']}}}TaxExclusiveAmount")
-                    lot.budget_with_taxes = self._get_decimal_codice(budget, f"{{{ns['basic']}}}TotalAmount")
-
-                cpv = project.find(f"{{{ns['agg']}}}RequiredCommodityClassification/{{{ns['basic']}}}ItemClassificationCode")
+                    lot.budget_without_taxes = self._get_decimal_codice(
+                        budget, "basic:TaxExclusiveAmount"
+                    )
+                    lot.budget_with_taxes = self._get_decimal_codice(budget, "basic:TotalAmount")
+
+                cpv = _codice_first(
+                    project, "agg:RequiredCommodityClassification/basic:ItemClassificationCode"
+                )
                 if cpv is not None:
-                    lot.cpv_code = cpv.text
+                    lot.cpv_code = _intern_code(cpv.text)
 
             lots.append(lot)
 
         return lots
 
-    def _extract_tendering_from_codice(self, tendering_elem: ET.Element, licitacion: PlacspLicitacion, ns: dict):
+    def _extract_tendering_from_codice(
+        self, tendering_elem: etree._Element, licitacion: PlacspLicitacion
+    ):
         """Extract tendering process details."""
-        proc_code = tendering_elem.find(f"{{{ns['basic']}}}ProcedureCode")
+        proc_code = _codice_first(tendering_elem, "basic:ProcedureCode")
         if proc_code is not None:
-            licitacion.procedure_type = proc_code.text
+            licitacion.procedure_type = _intern_code(proc_code.text)
 
-        system_code = tendering_elem.find(f"{{{ns['basic']}}}ProcurementSystemCode")
+        system_code = _codice_first(tendering_elem, "basic:ProcurementSystemCode")
         if system_code is not None:
-            licitacion.system_type = system_code.text
+            licitacion.system_type = _intern_code(system_code.text)
 
-    def _extract_results_from_codice(self, contract_folder: ET.Element, ns: dict) -> list[ContractResult]:
+    def _extract_results_from_codice(self, contract_folder: etree._Element) -> list[ContractResult]:
         """Extract results/awards from CODICE structure."""
         results = []
-        for result_elem in contract_folder.findall(f"{{{ns['agg']}}}TenderResult"):
+        for result_elem in _codice_children(contract_folder, "agg:TenderResult"):
             result = ContractResult()
 
-            code = result_elem.find(f"{{{ns['basic']}}}ResultCode")
+            code = _codice_first(result_elem, "basic:ResultCode")
             if code is not None:
-                result.result_status = code.text
+                result.result_status = _intern_code(code.text)
 
-            award_date = result_elem.find(f"{{{ns['basic']}}}AwardDate")
+            award_date = _codice_first(result_elem, "basic:AwardDate")
             if award_date is not None:
                 result.award_date = award_date.text
 
-            result.awarded_companies = self._extract_awarded_from_codice(result_elem, ns)
+            result.awarded_companies = self._extract_awarded_from_codice(result_elem)
 
             results.append(result)
 
         return results
 
-    def _extract_awarded_from_codice(self, result_elem: ET.Element, ns: dict) -> list[AwardedCompany]:
+    def _extract_awarded_from_codice(self, result_elem: etree._Element) -> list[AwardedCompany]:
         """Extract awarded companies from CODICE result."""
         companies = []
-        for supplier_elem in result_elem.findall(f"{{{ns['ext_agg']}}}AwardedSupplier"):
+        for supplier_elem in _codice_children(result_elem, "ext_agg:AwardedSupplier"):
             company = AwardedCompany()
 
-            party = supplier_elem.find(f"{{{ns['agg']}}}SupplierParty/{{{ns['agg']}}}Party")
+            party = _codice_first(supplier_elem, "agg:SupplierParty/agg:Party")
             if party is not None:
-                company.name = self._get_text_codice(party, f"{{{ns['agg']}}}PartyName/{{{ns['basic']}}}Name")
+                company.name = self._get_text_codice(party, "agg:PartyName/basic:Name")
 
-                id_elem = party.find(f"{{{ns['agg']}}}PartyIdentification/{{{ns['basic']}}}ID")
+                id_elem = _codice_first(party, "agg:PartyIdentification/basic:ID")
                 if id_elem is not None:
                     company.identifier = id_elem.text
                     company.identifier_type = id_elem.get("schemeName", "")
 
-            sme = supplier_elem.find(f"{{{ns['basic']}}}SMEIndicator")
+            sme = _codice_first(supplier_elem, "basic:SMEIndicator")
             if sme is not None and sme.text:
-                # Note: "sí" and "si" are Spanish for "yes" from PLACSP data
-                company.is_pyme = sme.text.lower() in ["true", "1", "sí", "si"]
+                company.is_pyme = _parse_bool(sme.text)
 
-            amount = supplier_elem.find(f"{{{ns['agg']}}}AwardAmount/{{{ns['basic']}}}TaxExclusiveAmount")
-            if amount is not None:
+            amount = _codice_first(supplier_elem, "agg:AwardAmount/basic:TaxExclusiveAmount")
+            if amount is not None and amount.text:
                 try:
-                    company.award_amount_without_taxes = Decimal(amount.text)
-                except:
+                    company.award_amount_without_taxes = _parse_money(amount.text)
+                except InvalidOperation:
                     pass
 
             companies.append(company)
 
         return companies
 
-    def _get_text_codice(self, elem: ET.Element, xpath: str) -> Optional[str]:
+    def _get_text_codice(self, elem: etree._Element, xpath: str) -> Optional[str]:
         """Get text using namespace-aware XPath."""
-        try:
-            found = elem.find(xpath)
-            if found is not None and found.text:
-                return found.text.strip()
-        except:
-            pass
+        found = _codice_first(elem, xpath)
+        if found is not None and found.text:
+            return found.text.strip()
         return None
 
-    def _get_decimal_codice(self, elem: ET.Element, xpath: str) -> Optional[Decimal]:
+    def _get_decimal_codice(self, elem: etree._Element, xpath: str) -> Optional[Decimal]:
         """Get decimal value from CODICE element."""
+        found = _codice_first(elem, xpath)
+        if found is None or not found.text:
+            return None
         try:
-            found = elem.find(xpath)
-            if found is not None and found.text:
-                return Decimal(found.text.strip())
-        except:
-            pass
-        return None
+            return _parse_money(found.text)
+        except InvalidOperation:
+            self.logger.debug(f"Failed to parse decimal {found.text}")
+            return None
 
-    def _extract_from_root(self, root: ET.Element, entry_id: str) -> Optional[PlacspLicitacion]:
+    def _extract_from_root(self, root: etree._Element, entry_id: str) -> Optional[PlacspLicitacion]:
         """
         Extract from parsed XML root element.
 
@@ -587,8 +766,8 @@ class PlacspFieldsExtractor:
         # Extract basic info
         licitacion.expedition_number = self._get_text(root, "pcsp:codigoExpediente")
         licitacion.contract_object = self._get_text(root, "pcsp:objetoContrato")
-        licitacion.status = self._get_text(root, "pcsp:estado")
-        licitacion.status_phase = self._get_text(root, "pcsp:fase")
+        licitacion.status = _intern_code(self._get_text(root, "pcsp:estado"))
+        licitacion.status_phase = _intern_code(self._get_text(root, "pcsp:fase"))
         licitacion.first_publication_date = self._get_text(root, "pcsp:fechaPrimeraPublicacion")
 
         # Budget
@@ -597,11 +776,13 @@ class PlacspFieldsExtractor:
         licitacion.budget_with_taxes = self._get_decimal(root, "pcsp:presupuestoConImpuestos")
 
         # Contract type
-        licitacion.contract_type = self._get_text(root, "pcsp:tipoContrato")
-        licitacion.cpv_code = self._get_text(root, "pcsp:cpv")
+        licitacion.contract_type = _intern_code(self._get_text(root, "pcsp:tipoContrato"))
+        licitacion.cpv_code = _intern_code(self._get_text(root, "pcsp:cpv"))
 
         # Location
-        licitacion.execution_place_nuts = self._get_text(root, "pcsp:lugarEjecucion/pcsp:codNUTS")
+        licitacion.execution_place_nuts = _intern_code(
+            self._get_text(root, "pcsp:lugarEjecucion/pcsp:codNUTS")
+        )
         licitacion.execution_place_name = self._get_text(root, "pcsp:lugarEjecucion/pcsp:denominacion")
         licitacion.postal_code = self._get_text(root, "pcsp:codigoPostal")
 
@@ -613,20 +794,21 @@ class PlacspFieldsExtractor:
         licitacion.authority_profile_link = self._get_text(root, "pcsp:enlacePerfilContratante")
 
         # Administration type
-        licitacion.administration_type = self._get_text(root, "pcsp:tipoAdministracion")
+        licitacion.administration_type = _intern_code(
+            self._get_text(root, "pcsp:tipoAdministracion")
+        )
 
         # Procedure
-        licitacion.procedure_type = self._get_text(root, "pcsp:tipoConvocatoria")
-        licitacion.system_type = self._get_text(root, "pcsp:sistemaContratacion")
-        licitacion.processing_type = self._get_text(root, "pcsp:tramitacion")
+        licitacion.procedure_type = _intern_code(self._get_text(root, "pcsp:tipoConvocatoria"))
+        licitacion.system_type = _intern_code(self._get_text(root, "pcsp:sistemaContratacion"))
+        licitacion.processing_type = _intern_code(self._get_text(root, "pcsp:tramitacion"))
         licitacion.offer_presentation_form = self._get_text(root, "pcsp:formaPresentacionOferta")
         licitacion.applicable_directive = self._get_text(root, "pcsp:directivaAplicable")
 
         # Subcontracting
         subcontracting_text = self._get_text(root, "pcsp:subcontratacionPermitida")
         if subcontracting_text:
-            # Note: "sí" and "si" are Spanish for "yes" from PLACSP data
-            licitacion.subcontracting_allowed = subcontracting_text.lower() in ["sí", "true", "si"]
+            licitacion.subcontracting_allowed = _parse_bool(subcontracting_text)
 
         licitacion.subcontracting_percentage = self._get_decimal(root, "pcsp:porcentajeSubcontratacion")
 
@@ -638,35 +820,35 @@ class PlacspFieldsExtractor:
 
         return licitacion
 
-    def _extract_lots(self, root: ET.Element) -> list[ContractLot]:
+    def _extract_lots(self, root: etree._Element) -> list[ContractLot]:
         """Extract all lots from the licitacion."""
         lots = []
 
         # Find all lote elements
-        for lote_elem in root.findall(".//pcsp:lote", self.NAMESPACES):
+        for lote_elem in _pcsp_xpath(".//pcsp:lote")(root):
             lot = ContractLot()
 
             lot.lot_number = self._get_text(lote_elem, "pcsp:numeroLote")
             lot.object = self._get_text(lote_elem, "pcsp:objeto")
             lot.budget_without_taxes = self._get_decimal(lote_elem, "pcsp:presupuestoSinImpuestos")
             lot.budget_with_taxes = self._get_decimal(lote_elem, "pcsp:presupuestoConImpuestos")
-            lot.cpv_code = self._get_text(lote_elem, "pcsp:cpv")
+            lot.cpv_code = _intern_code(self._get_text(lote_elem, "pcsp:cpv"))
             lot.execution_place = self._get_text(lote_elem, "pcsp:lugarEjecucion")
 
             lots.append(lot)
 
         return lots
 
-    def _extract_results(self, root: ET.Element) -> list[ContractResult]:
+    def _extract_results(self, root: etree._Element) -> list[ContractResult]:
         """Extract all results/awards from the licitacion."""
         results = []
 
         # Find all resultado elements
-        for resultado_elem in root.findall(".//pcsp:resultado", self.NAMESPACES):
+        for resultado_elem in _pcsp_xpath(".//pcsp:resultado")(root):
             result = ContractResult()
 
             result.lot_number = self._get_text(resultado_elem, "pcsp:numeroLote")
-            result.result_status = self._get_text(resultado_elem, "pcsp:estado")
+            result.result_status = _intern_code(self._get_text(resultado_elem, "pcsp:estado"))
             result.award_date = self._get_text(resultado_elem, "pcsp:fechaAdjudicacion")
             result.num_offers_received = self._get_int(resultado_elem, "pcsp:numeroOfertasRecibidas")
             result.lowest_offer_amount = self._get_decimal(resultado_elem, "pcsp:precioOfertaMasBaja")
@@ -674,8 +856,7 @@ class PlacspFieldsExtractor:
 
             abnormally_low = self._get_text(resultado_elem, "pcsp:ofertasExcluidasAbnormementebajas")
             if abnormally_low:
-                # Note: "sí" and "si" are Spanish for "yes" from PLACSP data
-                result.abnormally_low_offers_excluded = abnormally_low.lower() in ["sí", "true", "si"]
+                result.abnormally_low_offers_excluded = _parse_bool(abnormally_low)
 
             result.contract_number = self._get_text(resultado_elem, "pcsp:numeroContrato")
             result.contract_formalization_date = self._get_text(
@@ -690,11 +871,11 @@ class PlacspFieldsExtractor:
 
         return results
 
-    def _extract_awarded_companies(self, resultado_elem: ET.Element) -> list[AwardedCompany]:
+    def _extract_awarded_companies(self, resultado_elem: etree._Element) -> list[AwardedCompany]:
         """Extract all awarded companies from a result element."""
         companies = []
 
-        for adjudicatario_elem in resultado_elem.findall(".//pcsp:adjudicatario", self.NAMESPACES):
+        for adjudicatario_elem in _pcsp_xpath(".//pcsp:adjudicatario")(resultado_elem):
             company = AwardedCompany()
 
             company.name = self._get_text(adjudicatario_elem, "pcsp:denominacion")
@@ -703,8 +884,7 @@ class PlacspFieldsExtractor:
 
             is_pyme = self._get_text(adjudicatario_elem, "pcsp:esmenor")
             if is_pyme:
-                # Note: "sí" and "si" are Spanish for "yes" from PLACSP data
-                company.is_pyme = is_pyme.lower() in ["sí", "true", "si"]
+                company.is_pyme = _parse_bool(is_pyme)
 
             company.award_amount_without_taxes = self._get_decimal(
                 adjudicatario_elem, "pcsp:importeAdjudicacionSinImpuestos"
@@ -717,7 +897,9 @@ class PlacspFieldsExtractor:
 
         return companies
 
-    def _get_text(self, elem: ET.Element, xpath: str, default: Optional[str] = None) -> Optional[str]:
+    def _get_text(
+        self, elem: etree._Element, xpath: str, default: Optional[str] = None
+    ) -> Optional[str]:
         """
         Get text from element using XPath with namespaces.
 
@@ -730,15 +912,15 @@ class PlacspFieldsExtractor:
             Text content or default
         """
         try:
-            found = elem.find(xpath, self.NAMESPACES)
-            if found is not None and found.text:
-                return found.text.strip()
+            found = _pcsp_xpath(xpath)(elem)
+            if found and found[0].text:
+                return found[0].text.strip()
         except Exception as e:
             self.logger.debug(f"Error getting text from {xpath}: {e}")
 
         return default
 
-    def _get_decimal(self, elem: ET.Element, xpath: str) -> Optional[Decimal]:
+    def _get_decimal(self, elem: etree._Element, xpath: str) -> Optional[Decimal]:
         """
         Get decimal value from element.
 
@@ -756,31 +938,12 @@ class PlacspFieldsExtractor:
             return None
 
         try:
-            # Handle both Spanish (1.234,56) and English (1,234.56) formats
-            cleaned = text.strip()
-
-            # If there's both comma and dot, determine which is decimal separator
-            if "," in cleaned and "." in cleaned:
-                comma_pos = cleaned.rfind(",")
-                dot_pos = cleaned.rfind(".")
-
-                if comma_pos > dot_pos:
-                    # Spanish format: 1.234,56 -> remove dots, replace comma with dot
-                    cleaned = cleaned.replace(".", "").replace(",", ".")
-                else:
-                    # English format: 1,234.56 -> just remove commas
-                    cleaned = cleaned.replace(",", "")
-            elif "," in cleaned:
-                # Only comma - assume it's decimal separator (Spanish)
-                cleaned = cleaned.replace(",", ".")
-
-            # If only dots, leave as is (could be thousands or decimal)
-            return Decimal(cleaned)
+            return _parse_money(text)
         except Exception as e:
             self.logger.debug(f"Failed to parse decimal {text}: {e}")
             return None
 
-    def _get_int(self, elem: ET.Element, xpath: str) -> Optional[int]:
+    def _get_int(self, elem: etree._Element, xpath: str) -> Optional[int]:
         """
         Get integer value from element.
 
@@ -799,4 +962,4 @@ class PlacspFieldsExtractor:
             return int(text)
         except ValueError:
             self.logger.debug(f"Failed to parse integer {text}")
-            return None
\ No newline at end of file
+            return None
@@ -5,18 +5,139 @@ Manages the processing of multiple ZIP files containing PLACSP data.
 Ensures proper chronological ordering and handles the syndication
 chain correctly according to the OpenPLACSP manual.
 """
+import io
 import logging
 import re
+import struct
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
-from io import BytesIO
-from zipfile import ZipFile
+from functools import lru_cache
+from operator import attrgetter
+from typing import BinaryIO, Optional, Union
 
 import requests
+from lxml import etree, html
 
+from .atom_parser import _open_zip
 
-@dataclass
+
+# Dated ATOM files carry a YYYYMM or YYYYMMDD suffix; the base ATOM has none.
+# Maps ASCII digits to b"1" and every other byte to b"0", so a run of six
+# digits becomes a plain substring search instead of a regex scan.
+_DIGIT_TABLE = bytes(0x31 if 0x30 <= c <= 0x39 else 0x30 for c in range(256))
+_DATE_RUN = b"111111"
+
+
+def _has_date_suffix(name: str) -> bool:
+    """Return True if the filename contains a run of six or more digits."""
+    return _DATE_RUN in name.encode("utf-8", "surrogateescape").translate(_DIGIT_TABLE)
+
+
+# Directory listing links that can point to PLACSP ZIPs; the ".zip" suffix is
+# checked in Python since XPath 1.0 has no ends-with()
+_PLACSP_HREFS = etree.XPath("//a/@href[contains(., 'PLACSP')]", smart_strings=False)
+
+
+# End-of-central-directory record and central directory file header layouts
+_EOCD = struct.Struct("<4s4H2LH")
+_CD_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_CD_SIGNATURE = b"PK\x01\x02"
+_UTF8_NAME_FLAG = 0x800
+# Offset of the local header offset field within a central directory header
+_CD_HEADER_OFFSET_FIELD = 42
+# The EOCD is 22 bytes plus a comment of up to 64 KiB
+_EOCD_MAX_SIZE = _EOCD.size + 0xFFFF
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def _locate_central_directory(tail: bytes) -> Optional[tuple[int, int, int, int]]:
+    """
+    Find the end-of-central-directory record in the end of a ZIP.
+
+    Args:
+        tail: Last bytes of the archive, EOCD included
+
+    Returns:
+        (EOCD position in tail, entry count, central directory size,
+        central directory offset), or None for archives this reader does
+        not handle (ZIP64, corrupt or missing EOCD)
+    """
+    eocd = tail.rfind(_EOCD_SIGNATURE, max(0, len(tail) - _EOCD_MAX_SIZE))
+    if eocd < 0 or eocd + _EOCD.size > len(tail):
+        return None
+
+    _, _, _, _, total_entries, cd_size, cd_offset, _ = _EOCD.unpack_from(tail, eocd)
+    if total_entries == 0xFFFF or cd_offset == 0xFFFFFFFF:
+        return None
+    return eocd, total_entries, cd_size, cd_offset
+
+
+def _read_central_directory(
+    cd: bytes, total_entries: int
+) -> Optional[list[tuple[str, bytes, int]]]:
+    """
+    Read the members of a ZIP central directory.
+
+    Args:
+        cd: Central directory bytes
+        total_entries: Entry count from the EOCD
+
+    Returns:
+        (name, raw central directory header, local header offset) per member
+        in central directory order, or None if the directory is malformed
+        or uses ZIP64 offsets
+    """
+    members = []
+    pos = 0
+    for _ in range(total_entries):
+        if pos + _CD_HEADER.size > len(cd):
+            return None
+
+        header = _CD_HEADER.unpack_from(cd, pos)
+        if header[0] != _CD_SIGNATURE or header[18] == 0xFFFFFFFF:
+            return None
+
+        flag_bits = header[5]
+        name_length, extra_length, comment_length = header[12], header[13], header[14]
+        name_start = pos + _CD_HEADER.size
+        end = name_start + name_length + extra_length + comment_length
+        if end > len(cd):
+            return None
+
+        raw_name = cd[name_start:name_start + name_length]
+        name = raw_name.decode("utf-8" if flag_bits & _UTF8_NAME_FLAG else "cp437")
+        members.append((name, cd[pos:end], header[18]))
+        pos = end
+
+    return members
+
+
+def _content_range_start(
+    response: requests.Response, total: Optional[int] = None
+) -> Optional[int]:
+    """
+    Return the first byte offset of a 206 response, checking it is well formed.
+
+    Args:
+        response: Response to a Range request
+        total: Expected full archive size, if already known
+
+    Returns:
+        Start offset, or None if the response is not a usable partial response
+    """
+    if response.status_code != 206:
+        return None
+
+    match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+    if not match or (total is not None and int(match[3]) != total):
+        return None
+    return int(match[1])
+
+
+@dataclass(slots=True)
 class PlacspZipInfo:
     """Information about a PLACSP ZIP file."""
 
@@ -42,44 +163,31 @@ class PlacspZipDateExtractor:
     - licitacionesPerfilesContratanteCompleto3_2021.zip (YYYY format)
     """
 
-    # Pattern for YYYYMM (e.g., 202101 for January 2021)
-    PATTERN_YYYYMM = re.compile(r"(\d{4})(\d{2})")
+    # Pattern for YYYYMM (e.g., 202101 for January 2021); invalid months
+    # such as 202113 are rejected by the regex itself
+    PATTERN_YYYYMM = re.compile(r"(?P<year>20\d{2})(?P<month>0[1-9]|1[0-2])")
+
+    # Pattern for YYYY (e.g., 2021), anchored on the extension
+    PATTERN_YYYY = re.compile(r"_(?P<year>20\d{2})\.(?:zip|ZIP)\Z")
 
-    # Pattern for YYYY (e.g., 2021)
-    PATTERN_YYYY = re.compile(r"_(\d{4})(?:\.zip|\.ZIP)")
+    # Pattern for the syndication ID (e.g., "3" in "...Completo3_202101.zip")
+    PATTERN_SYNDICATION_ID = re.compile(r"Completo(?P<id>\d+)")
 
     @classmethod
     def extract_date(cls, filename: str) -> Optional[datetime]:
         """
         Extract date from PLACSP ZIP filename.
 
+        Results are cached per filename, since the same listing is
+        re-parsed on every discovery pass.
+
         Args:
             filename: ZIP filename
 
         Returns:
             datetime object or None if date cannot be extracted
         """
-        # Look for YYYYMM pattern
-        match = cls.PATTERN_YYYYMM.search(filename)
-        if match:
-            try:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                if 1 <= month <= 12:
-                    return datetime(year, month, 1)
-            except (ValueError, IndexError):
-                pass
-
-        # Fall back to YYYY pattern
-        match = cls.PATTERN_YYYY.search(filename)
-        if match:
-            try:
-                year = int(match.group(1))
-                return datetime(year, 1, 1)
-            except ValueError:
-                pass
-
-        return None
+        return _extract_zip_date(filename)
 
     @classmethod
     def extract_syndication_id(cls, filename: str) -> Optional[str]:
@@ -95,11 +203,43 @@ class PlacspZipDateExtractor:
         Returns:
             Syndication ID or None
         """
-        # Look for numbers in specific patterns
-        match = re.search(r"Completo(\d+)", filename)
-        if match:
-            return match.group(1)
-        return None
+        return _extract_syndication_id(filename)
+
+
+@lru_cache(maxsize=4096)
+def _extract_zip_date(filename: str) -> Optional[datetime]:
+    """
+    Parse the date encoded in a PLACSP ZIP filename.
+
+    Returns:
+        datetime object or None if date cannot be extracted
+    """
+    # Look for YYYYMM pattern
+    match = PlacspZipDateExtractor.PATTERN_YYYYMM.search(filename)
+    if match:
+        return datetime(int(match["year"]), int(match["month"]), 1)
+
+    # Fall back to YYYY pattern
+    match = PlacspZipDateExtractor.PATTERN_YYYY.search(filename)
+    if match:
+        return datetime(int(match["year"]), 1, 1)
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _extract_syndication_id(filename: str) -> Optional[str]:
+    """
+    Parse the syndication ID from a PLACSP ZIP filename.
+
+    Returns:
+        Syndication ID or None
+    """
+    # Look for numbers in specific patterns
+    match = PlacspZipDateExtractor.PATTERN_SYNDICATION_ID.search(filename)
+    if match:
+        return match["id"]
+    return None
 
 
 class ZipOrchestrator:
@@ -112,6 +252,10 @@ class ZipOrchestrator:
     3. Syndication chains are properly followed
     """
 
+    # Downloads larger than this are spooled to a temporary file on disk
+    SPOOL_MAX_SIZE = 32 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
     def __init__(self, session: Optional[requests.Session] = None, logger: Optional[logging.Logger] = None):
         """
         Initialize orchestrator.
@@ -137,20 +281,21 @@ class ZipOrchestrator:
         Raises:
             Exception: If discovery fails
         """
-        from bs4 import BeautifulSoup
-
         try:
             response = self.session.get(base_url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
             zips = []
-
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-
+            # lxml.html cannot build a document from an empty body
+            hrefs = (
+                _PLACSP_HREFS(html.fromstring(response.content))
+                if response.content.strip()
+                else []
+            )
+
+            for href in hrefs:
                 # Look for PLACSP ZIP files
-                if "PLACSP" in href and href.endswith(".zip"):
+                if href.endswith(".zip"):
                     filename = href.split("/")[-1]
                     zip_info = PlacspZipInfo(filename=filename)
 
@@ -189,16 +334,20 @@ class ZipOrchestrator:
         with_dates = [z for z in zips if z.date]
         without_dates = [z for z in zips if not z.date]
 
-        # Sort those with dates
-        with_dates.sort()
+        # Sort those with dates; a key sort compares datetimes in C instead of
+        # dispatching PlacspZipInfo.__lt__ per comparison (same stable order)
+        with_dates.sort(key=attrgetter("date"))
 
         # Log sorting
-        for z in with_dates:
-            self.logger.debug(f"ZIP order: {z.filename} ({z.date})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for z in with_dates:
+                self.logger.debug(f"ZIP order: {z.filename} ({z.date})")
 
         return with_dates + without_dates
 
-    def identify_base_atom_filename(self, zip_info: PlacspZipInfo, zip_content: bytes) -> Optional[str]:
+    def identify_base_atom_filename(
+        self, zip_info: PlacspZipInfo, zip_content: Union[bytes, BinaryIO]
+    ) -> Optional[str]:
         """
         Identify the base ATOM filename within a ZIP.
 
@@ -207,67 +356,224 @@ class ZipOrchestrator:
 
         Args:
             zip_info: PlacspZipInfo object
-            zip_content: Raw ZIP file bytes
+            zip_content: Raw ZIP file bytes or a seekable binary file object
 
         Returns:
             Base ATOM filename or None
         """
         try:
-            with ZipFile(BytesIO(zip_content)) as zf:
-                atom_files = [f for f in zf.namelist() if f.endswith(".atom")]
+            with _open_zip(zip_content) as zf:
+                return self._select_base_atom(zip_info, zf.namelist())
 
-                if not atom_files:
-                    self.logger.warning(f"No ATOM file found in {zip_info.filename}")
-                    return None
-
-                # Look for the base ATOM (typically the one without a date suffix)
-                base_atoms = [f for f in atom_files if not re.search(r"\d{6,8}", f)]
+        except Exception as e:
+            self.logger.error(f"Failed to identify base ATOM in {zip_info.filename}: {e}")
+            return None
 
-                if base_atoms:
-                    base_atom = base_atoms[0]
-                    zip_info.base_atom_filename = base_atom
-                    self.logger.debug(f"Identified base ATOM: {base_atom}")
-                    return base_atom
+    def _select_base_atom(self, zip_info: PlacspZipInfo, names: list[str]) -> Optional[str]:
+        """
+        Pick the base ATOM out of a ZIP's member names.
 
-                # If no base atom without date, use the first one
-                zip_info.base_atom_filename = atom_files[0]
-                return atom_files[0]
+        Args:
+            zip_info: PlacspZipInfo object, updated with the chosen name
+            names: Member names in central directory order
 
-        except Exception as e:
-            self.logger.error(f"Failed to identify base ATOM in {zip_info.filename}: {e}")
+        Returns:
+            Base ATOM filename or None
+        """
+        # Look for the base ATOM (typically the one without a date suffix),
+        # stopping at the first one in central directory order
+        first_atom = None
+        for name in names:
+            if not name.endswith(".atom"):
+                continue
+
+            if not _has_date_suffix(name):
+                zip_info.base_atom_filename = name
+                self.logger.debug(f"Identified base ATOM: {name}")
+                return name
+
+            if first_atom is None:
+                first_atom = name
+
+        if first_atom is None:
+            self.logger.warning(f"No ATOM file found in {zip_info.filename}")
             return None
 
-    def extract_base_atom_content(self, zip_content: bytes, base_atom_filename: str) -> Optional[bytes]:
+        # If no base atom without date, use the first one
+        zip_info.base_atom_filename = first_atom
+        return first_atom
+
+    def extract_base_atom_content(
+        self, zip_content: Union[bytes, BinaryIO], base_atom_filename: str
+    ) -> Optional[bytes]:
         """
         Extract the base ATOM file content from a ZIP.
 
         Args:
-            zip_content: Raw ZIP file bytes
+            zip_content: Raw ZIP file bytes or a seekable binary file object
             base_atom_filename: Filename of base ATOM
 
         Returns:
             ATOM file content or None
         """
         try:
-            with ZipFile(BytesIO(zip_content)) as zf:
-                if base_atom_filename in zf.namelist():
-                    return zf.read(base_atom_filename)
-                else:
+            with _open_zip(zip_content) as zf:
+                # getinfo() is a central-directory lookup, no namelist scan
+                try:
+                    atom_info = zf.getinfo(base_atom_filename)
+                except KeyError:
                     self.logger.error(f"ATOM file not found in ZIP: {base_atom_filename}")
                     return None
+                return zf.read(atom_info)
         except Exception as e:
             self.logger.error(f"Failed to extract ATOM from ZIP: {e}")
             return None
 
-    def fetch_and_prepare_zip(self, zip_info: PlacspZipInfo) -> tuple[bytes, Optional[str]]:
+    def _download_range(self, url: str, start: int, length: int, total: int, out: BinaryIO) -> bool:
+        """
+        Stream one byte range of a remote file into a file object.
+
+        Args:
+            url: File URL
+            start: First byte offset
+            length: Number of bytes to copy
+            total: Full file size, checked against Content-Range
+            out: File object to write to
+
+        Returns:
+            True if exactly the requested bytes were written
+        """
+        headers = {"Range": f"bytes={start}-{start + length - 1}"}
+        with self.session.get(url, headers=headers, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            if _content_range_start(response, total) != start:
+                return False
+
+            written = 0
+            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                # Never trust the server to stop at the end of the range
+                chunk = chunk[:length - written]
+                out.write(chunk)
+                written += len(chunk)
+                if written == length:
+                    break
+
+        return written == length
+
+    def _download_base_atom(self, zip_info: PlacspZipInfo, zip_file: BinaryIO) -> bool:
+        """
+        Write a ZIP holding only the base ATOM of a remote archive to zip_file.
+
+        The tail of the archive is requested first, which covers the
+        end-of-central-directory record and usually the central directory
+        itself. The base ATOM's compressed data is then fetched with one
+        streamed Range request and followed by its central directory record,
+        so the result is a valid single-member archive. A server that ignores
+        the Range header sends the whole archive, which is spooled as is.
+
+        Args:
+            zip_info: PlacspZipInfo object with URL
+            zip_file: Empty file object to write the archive to
+
+        Returns:
+            True if zip_file holds an archive, False if the archive layout
+            or the server's responses could not be used
+        """
+        url = zip_info.url
+        headers = {"Range": f"bytes=-{_EOCD_MAX_SIZE}"}
+        with self.session.get(url, headers=headers, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                self._spool_response(response, zip_file)
+                return True
+
+            match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+            if not match or int(match[2]) + 1 != int(match[3]):
+                return False
+            tail_start, total = int(match[1]), int(match[3])
+            tail = response.content
+
+        directory = self._read_remote_directory(url, tail_start, total, tail)
+        if directory is None:
+            return False
+
+        members, cd_offset = directory
+        base_atom = self._select_base_atom(zip_info, [name for name, _, _ in members])
+        if base_atom is None:
+            return False
+
+        record, start = next((rec, offset) for name, rec, offset in members if name == base_atom)
+        # The member spans from its local header to the next one (or the central directory)
+        end = min((offset for _, _, offset in members if offset > start), default=cd_offset)
+
+        self.logger.info(f"Fetching {base_atom} via range requests: {url}")
+        if not self._download_range(url, start, end - start, total, zip_file):
+            return False
+
+        record = bytearray(record)
+        struct.pack_into("<L", record, _CD_HEADER_OFFSET_FIELD, 0)
+        zip_file.write(record)
+        zip_file.write(_EOCD.pack(_EOCD_SIGNATURE, 0, 0, 1, 1, len(record), end - start, 0))
+        return True
+
+    def _read_remote_directory(
+        self, url: str, tail_start: int, total: int, tail: bytes
+    ) -> Optional[tuple[list[tuple[str, bytes, int]], int]]:
+        """
+        Read the central directory of a remote ZIP from its tail.
+
+        The directory is fetched with one more Range request when it starts
+        before the tail.
+
+        Args:
+            url: ZIP URL
+            tail_start: Offset of the tail within the archive
+            total: Full archive size
+            tail: Last bytes of the archive, EOCD included
+
+        Returns:
+            Tuple of (members as returned by _read_central_directory,
+            central directory offset), or None if it could not be read
+        """
+        located = _locate_central_directory(tail) if len(tail) == total - tail_start else None
+        if located is None:
+            return None
+
+        eocd, total_entries, cd_size, cd_offset = located
+        if cd_offset + cd_size != tail_start + eocd:
+            return None
+
+        if cd_offset >= tail_start:
+            cd = tail[cd_offset - tail_start:eocd]
+        else:
+            cd_buffer = io.BytesIO()
+            if not self._download_range(url, cd_offset, cd_size, total, cd_buffer):
+                return None
+            cd = cd_buffer.getvalue()
+
+        members = _read_central_directory(cd, total_entries)
+        return (members, cd_offset) if members else None
+
+    def _spool_response(self, response: requests.Response, zip_file: BinaryIO) -> None:
+        """Write a streamed response body to zip_file."""
+        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+            zip_file.write(chunk)
+
+    def fetch_and_prepare_zip(self, zip_info: PlacspZipInfo) -> tuple[BinaryIO, Optional[str]]:
         """
         Fetch ZIP from URL and identify base ATOM.
 
+        When the server supports byte ranges only the base ATOM is downloaded
+        (see _download_base_atom). Otherwise, or if any range request fails,
+        the whole body is streamed into a spooled temporary file: archives up
+        to SPOOL_MAX_SIZE stay in memory, larger ones roll over to disk, so
+        peak memory does not grow with the archive size.
+
         Args:
             zip_info: PlacspZipInfo object with URL
 
         Returns:
-            Tuple of (zip_content, base_atom_filename)
+            Tuple of (zip_file, base_atom_filename); the caller must close zip_file
 
         Raises:
             Exception: If fetching or processing fails
@@ -275,19 +581,30 @@ class ZipOrchestrator:
         if not zip_info.url:
             raise ValueError(f"No URL for ZIP: {zip_info.filename}")
 
+        zip_file = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)
         try:
-            self.logger.info(f"Fetching ZIP: {zip_info.url}")
-            response = self.session.get(zip_info.url, timeout=60)
-            response.raise_for_status()
-
-            zip_content = response.content
+            try:
+                prepared = self._download_base_atom(zip_info, zip_file)
+            except (OSError, ValueError, requests.RequestException) as e:
+                self.logger.debug(f"Range download failed for {zip_info.url}: {e}")
+                prepared = False
+
+            if not prepared:
+                zip_file.seek(0)
+                zip_file.truncate()
+                self.logger.info(f"Fetching ZIP: {zip_info.url}")
+                with self.session.get(zip_info.url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+                    self._spool_response(response, zip_file)
+            zip_file.seek(0)
 
             # Identify base ATOM
-            base_atom = self.identify_base_atom_filename(zip_info, zip_content)
+            base_atom = self.identify_base_atom_filename(zip_info, zip_file)
 
-            return zip_content, base_atom
+            return zip_file, base_atom
 
         except Exception as e:
+            zip_file.close()
             self.logger.error(f"Failed to fetch/prepare ZIP {zip_info.url}: {e}")
             raise
 
@@ -313,8 +630,11 @@ class ZipOrchestrator:
 
         sorted_zips = self.sort_zips_chronologically(zips)
 
-        self.logger.info("Processing order:")
-        for i, z in enumerate(sorted_zips, 1):
-            self.logger.info(f"  {i}. {z.filename} ({z.date})")
+        # One record for the whole listing, only built when INFO is enabled
+        if self.logger.isEnabledFor(logging.INFO):
+            listing = "\n".join(
+                f"  {i}. {z.filename} ({z.date})" for i, z in enumerate(sorted_zips, 1)
+            )
+            self.logger.info(f"Processing order:\n{listing}")
 
-        return sorted_zips
\ No newline at end of file
+        return sorted_zips
@@ -4,6 +4,7 @@ Handles multiple date formats commonly found in Spanish public procurement data.
 Provides consistent ISO 8601 output for database storage.
 """
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import logging
 
@@ -57,16 +58,10 @@ class DateHandler:
         # Clean input
         date_str = str(date_str).strip()
         
-        # Try each supported format
-        for fmt in self.SUPPORTED_FORMATS:
-            try:
-                parsed = datetime.strptime(date_str, fmt)
-                return parsed.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        
-        self.logger.debug(f"Could not parse date: {date_str}")
-        return None
+        iso_date = _parse_to_iso(date_str)
+        if iso_date is None:
+            self.logger.debug(f"Could not parse date: {date_str}")
+        return iso_date
     
     def is_valid_date(self, date_str: str) -> bool:
         """Check if string is a valid date.
@@ -78,3 +73,53 @@ class DateHandler:
             True if valid date, False otherwise
         """
         return self.parse_to_iso(date_str) is not None
+
+
+def _guess_format(date_str: str) -> Optional[str]:
+    """Pick the supported format matching the shape of a date string.
+    
+    Looks only at the length and separator positions, so the common
+    zero-padded inputs need a single strptime call.
+    
+    Returns:
+        Format string, or None if the shape is not recognised
+    """
+    length = len(date_str)
+    if length == 10:
+        if date_str[4] == "-":
+            return "%Y-%m-%d"
+        if date_str[4] == "/":
+            return "%Y/%m/%d"
+        return {"/": "%d/%m/%Y", "-": "%d-%m-%Y", ".": "%d.%m.%Y"}.get(date_str[2])
+    if length >= 19 and date_str[10] == "T":
+        return "%Y-%m-%dT%H:%M:%S" if length == 19 else "%Y-%m-%dT%H:%M:%S.%f"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_to_iso(date_str: str) -> Optional[str]:
+    """Parse a cleaned date string to YYYY-MM-DD.
+    
+    Cached because contract dates repeat heavily across a feed. The
+    shape-guessed format is tried first; other formats are only tried
+    in SUPPORTED_FORMATS order when it fails (e.g. non-padded days).
+    
+    Returns:
+        ISO 8601 date string or None if no supported format matches
+    """
+    guessed = _guess_format(date_str)
+    if guessed is not None:
+        try:
+            return datetime.strptime(date_str, guessed).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    
+    for fmt in DateHandler.SUPPORTED_FORMATS:
+        if fmt == guessed:
+            continue
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    
+    return None
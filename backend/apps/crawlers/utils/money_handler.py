@@ -4,6 +4,7 @@ Handles money values in various formats including Spanish and US number formatti
 Provides Decimal output for financial precision.
 """
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any, Optional
 import logging
 
@@ -50,30 +51,21 @@ class MoneyHandler:
         if not value:
             return None
         
-        try:
-            # Handle numeric types directly
-            if isinstance(value, Decimal):
-                return value
-            
-            if isinstance(value, (int, float)):
-                return Decimal(str(value))
-            
-            # Parse string
-            cleaned = self._clean_money_string(str(value))
-            
-            if not cleaned:
-                return None
-            
-            # Detect format and convert to standard decimal format
-            cleaned = self._normalize_decimal_separators(cleaned)
-            
-            return Decimal(cleaned)
-            
-        except (InvalidOperation, ValueError) as e:
-            self.logger.debug(f"Could not parse money value '{value}': {e}")
-            return None
+        # Handle numeric types directly
+        if isinstance(value, Decimal):
+            return value
+        
+        if isinstance(value, (int, float)):
+            return Decimal(str(value))
+        
+        # Parse string
+        decimal_value = _parse_money_str(str(value))
+        if decimal_value is None:
+            self.logger.debug(f"Could not parse money value '{value}'")
+        return decimal_value
     
-    def _clean_money_string(self, value: str) -> str:
+    @staticmethod
+    def _clean_money_string(value: str) -> str:
         """Remove currency symbols and whitespace from money string.
         
         Args:
@@ -85,12 +77,13 @@ class MoneyHandler:
         cleaned = value
         
         # Remove currency symbols and whitespace
-        for symbol in self.CURRENCY_SYMBOLS:
+        for symbol in MoneyHandler.CURRENCY_SYMBOLS:
             cleaned = cleaned.replace(symbol, "")
         
         return cleaned.strip()
     
-    def _normalize_decimal_separators(self, value: str) -> str:
+    @staticmethod
+    def _normalize_decimal_separators(value: str) -> str:
         """Normalize decimal separators to standard format (dot as decimal).
         
         Handles both Spanish (1.234,56) and US (1,234.56) formats.
@@ -153,3 +146,24 @@ class MoneyHandler:
         formatted = f"{value:,.2f}"
         
         return f"{symbol}{formatted}"
+
+
+@lru_cache(maxsize=8192)
+def _parse_money_str(value: str) -> Optional[Decimal]:
+    """Parse a money string to Decimal.
+    
+    Cached because budgets and award amounts repeat heavily across a
+    feed (round figures, lots sharing a budget). Decimal is immutable,
+    so returning the same instance is safe.
+    
+    Returns:
+        Decimal value or None if the string is not a valid amount
+    """
+    cleaned = MoneyHandler._clean_money_string(value)
+    if not cleaned:
+        return None
+    
+    try:
+        return Decimal(MoneyHandler._normalize_decimal_separators(cleaned))
+    except (InvalidOperation, ValueError):
+        return None
@@ -3,10 +3,20 @@
 Extracts region information from contracting authority names based on
 keyword matching against Spanish autonomous communities and provinces.
 """
+from functools import lru_cache
 from typing import Optional, Dict, List
 import logging
 
 
+# Accented letters folded to their base form, so "Malaga" matches "málaga"
+_ACCENT_TRANS = str.maketrans("áéíóúàèòüñç", "aeiouaeounc")
+
+
+def _fold(text: str) -> str:
+    """Casefold and strip Spanish/Catalan accents for keyword matching."""
+    return text.casefold().translate(_ACCENT_TRANS)
+
+
 class RegionExtractor:
     """Extracts Spanish autonomous community from authority name.
     
@@ -109,17 +119,14 @@ class RegionExtractor:
         if not authority:
             return ""
         
-        authority_lower = authority.lower()
+        region, keyword = _match_region(_fold(authority))
         
-        # Check each region's keywords
-        for region, keywords in self.REGION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in authority_lower:
-                    self.logger.debug(
-                        f"Matched region '{region}' for authority '{authority}' "
-                        f"using keyword '{keyword}'"
-                    )
-                    return region
+        if region:
+            self.logger.debug(
+                f"Matched region '{region}' for authority '{authority}' "
+                f"using keyword '{keyword}'"
+            )
+            return region
         
         self.logger.debug(f"No region found for authority: {authority}")
         return ""
@@ -142,3 +149,28 @@ class RegionExtractor:
             True if region is in the supported list
         """
         return region in self.REGION_KEYWORDS
+
+
+# Folded keywords per region, in REGION_KEYWORDS order; accent variants such
+# as "aragón"/"aragon" collapse into a single entry
+_FOLDED_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (region, tuple(dict.fromkeys(_fold(keyword) for keyword in keywords)))
+    for region, keywords in RegionExtractor.REGION_KEYWORDS.items()
+)
+
+
+@lru_cache(maxsize=65536)
+def _match_region(authority_folded: str) -> tuple[str, str]:
+    """Scan region keywords for a folded (see _fold) authority name.
+    
+    Cached because the same contracting authorities appear across
+    thousands of contracts.
+    
+    Returns:
+        Tuple of (region, matched keyword), or ("", "") if none matches
+    """
+    for region, keywords in _FOLDED_KEYWORDS:
+        for keyword in keywords:
+            if keyword in authority_folded:
+                return region, keyword
+    return "", ""
@@ -8,3 +8,7 @@ class ProvidersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.providers"
     verbose_name = "Providers"
+
+    def ready(self) -> None:
+        """Register signal handlers."""
+        from apps.providers import signals  # noqa: F401
@@ -5,21 +5,31 @@ Provides classes for querying BOE and PCSP APIs to enrich provider data
 with website, industry, founding year, and other business information.
 """
 
+import hashlib
 import logging
 import re
 from typing import Any, Optional
 from urllib.parse import quote
 
 import requests
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Separators stripped from phone numbers
+_PHONE_SEPARATORS = re.compile(r"[\s\-\(\)]+")
+
 
 class APIEnricher:
     """Base class for API enrichers."""
 
     TIMEOUT = 10
     MAX_RETRIES = 2
+    RETRY_BACKOFF = 0.3
+    # Keep-alive connections kept per host; sized for threaded batch lookups
+    POOL_MAXSIZE = 64
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
@@ -27,7 +37,17 @@ class APIEnricher:
         self._setup_session()
 
     def _setup_session(self) -> None:
-        """Configure session headers."""
+        """Configure retries, connection pooling and session headers."""
+        retry_strategy = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         self.session.headers.update({
             "User-Agent": "PublicWorks-AI/1.0 (+https://github.com/)"
         })
@@ -47,6 +67,9 @@ class PCSPEnricher(APIEnricher):
 
     BASE_URL = "https://contrataciondelsectorpublico.gob.es/wlpl/rest"
 
+    # Search results are reused for a day; failed requests are not cached
+    CACHE_TIMEOUT = 24 * 60 * 60
+
     def search_provider(self, tax_id: str, company_name: str) -> dict[str, Any]:
         """Search PCSP for provider information."""
         # Try tax ID first (more precise)
@@ -69,23 +92,10 @@ class PCSPEnricher(APIEnricher):
         nif = nif.upper().strip()
 
         try:
-            endpoint = f"{self.BASE_URL}/empresas/search"
-            params = {
-                "query": f"nif:{nif}",
-                "page": "1",
-                "pageSize": "5"
-            }
-
-            response = self.session.get(
-                endpoint,
-                params=params,
-                timeout=self.TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
+            items = self._search_companies(f"nif:{nif}", page_size=5)
 
-            if data.get("items"):
-                return self._extract_company_info(data["items"][0])
+            if items:
+                return self._extract_company_info(items[0])
 
             return {"found": False, "source": "pcsp", "nif": nif}
 
@@ -97,23 +107,10 @@ class PCSPEnricher(APIEnricher):
     def _search_by_name(self, name: str) -> dict[str, Any]:
         """Search by company name."""
         try:
-            endpoint = f"{self.BASE_URL}/empresas/search"
-            params = {
-                "query": f"nombre:{name}",
-                "page": "1",
-                "pageSize": "3"
-            }
+            items = self._search_companies(f"nombre:{name}", page_size=3)
 
-            response = self.session.get(
-                endpoint,
-                params=params,
-                timeout=self.TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("items"):
-                return self._extract_company_info(data["items"][0])
+            if items:
+                return self._extract_company_info(items[0])
 
             return {"found": False, "source": "pcsp", "name": name}
 
@@ -122,6 +119,32 @@ class PCSPEnricher(APIEnricher):
                 logger.warning(f"PCSP name search failed ({name}): {e}")
             return {"found": False, "error": str(e), "source": "pcsp"}
 
+    def _search_companies(self, query: str, page_size: int) -> list[dict[str, Any]]:
+        """
+        Run a PCSP company search, reusing cached results.
+
+        The same NIFs and names come back on every enrichment run, so
+        results are kept in the Django cache for CACHE_TIMEOUT.
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        digest = hashlib.sha1(f"{page_size}:{query}".encode()).hexdigest()
+        cache_key = f"providers:pcsp:search:{digest}"
+
+        items = cache.get(cache_key)
+        if items is None:
+            response = self.session.get(
+                f"{self.BASE_URL}/empresas/search",
+                params={"query": query, "page": "1", "pageSize": str(page_size)},
+                timeout=self.TIMEOUT
+            )
+            response.raise_for_status()
+            items = response.json().get("items") or []
+            cache.set(cache_key, items, self.CACHE_TIMEOUT)
+
+        return items
+
     def _extract_company_info(self, item: dict[str, Any]) -> dict[str, Any]:
         """Extract structured company information from PCSP response."""
         result: dict[str, Any] = {"found": True, "source": "pcsp"}
@@ -168,8 +191,7 @@ class PCSPEnricher(APIEnricher):
     def _normalize_phone(phone: str) -> str:
         """Extract and normalize phone number."""
         # Remove common separators
-        phone = re.sub(r"[\s\-\(\)]+", "", phone)
-        return phone
+        return _PHONE_SEPARATORS.sub("", phone)
 
     @staticmethod
     def _extract_year(year_input: Optional[Any]) -> Optional[int]:
@@ -177,6 +199,10 @@ class PCSPEnricher(APIEnricher):
         if not year_input:
             return None
 
+        # Plain in-range integers need no string round-trip
+        if type(year_input) is int and 1800 <= year_input <= 2100:
+            return year_input
+
         try:
             year_str = str(year_input).strip()
             year = int(year_str[-4:])  # Get last 4 digits
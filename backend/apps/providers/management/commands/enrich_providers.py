@@ -16,27 +16,62 @@ Usage:
     python manage.py enrich_providers --filter-region CA   # Only specific region
     python manage.py enrich_providers --filter-flagged     # Only flagged providers
     python manage.py enrich_providers --dry-run            # Simulate without saving
+    python manage.py enrich_providers --workers 16         # More concurrent lookups
     python manage.py enrich_providers -v                   # Verbose output
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from typing import Any, Optional
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.db.models import Q
 
 from apps.providers.enrichment import EnrichmentPipeline
 from apps.providers.models import Provider
+from apps.providers.signals import invalidate_provider_stats
 
 logger = logging.getLogger(__name__)
 
+# Providers with at least one field enrichment could still fill in; the text
+# fields are blank rather than NULL when missing
+NEEDS_ENRICHMENT = (
+    Q(website="")
+    | Q(industry="")
+    | Q(founded_year__isnull=True)
+    | Q(email="")
+    | Q(phone="")
+    | Q(company_size="")
+    | Q(legal_name="")
+)
+
 
 class ProviderBatchEnricher:
     """Orchestrate provider enrichment from external sources."""
 
-    def __init__(self, verbose: bool = False, dry_run: bool = False):
+    # Concurrent API lookups; lookups are network-bound, saves stay sequential
+    DEFAULT_WORKERS = 8
+
+    # Enriched providers written per bulk_update round-trip
+    SAVE_BATCH_SIZE = 500
+
+    # Every field enrich_provider may fill in
+    ENRICHED_FIELDS = [
+        "website",
+        "industry",
+        "founded_year",
+        "email",
+        "phone",
+        "company_size",
+        "legal_name",
+    ]
+
+    def __init__(self, verbose: bool = False, dry_run: bool = False, workers: Optional[int] = None):
         self.verbose = verbose
         self.dry_run = dry_run
+        self.workers = workers or self.DEFAULT_WORKERS
         self.pipeline = EnrichmentPipeline(verbose=verbose)
         self.stats = {
             "total": 0,
@@ -49,13 +84,24 @@ class ProviderBatchEnricher:
             "errors": 0,
         }
 
-    def enrich_provider(self, provider: Provider) -> bool:
-        """Enrich a single provider."""
+    def enrich_provider(
+        self, provider: Provider, enriched_data: Optional[dict[str, Any]] = None, save: bool = True
+    ) -> bool:
+        """Enrich a single provider.
+
+        Args:
+            provider: Provider to update
+            enriched_data: Pipeline result already fetched for this provider;
+                queried from the pipeline when omitted
+            save: Save the changed fields now; batch callers pass False and
+                write the provider themselves
+        """
         self.stats["total"] += 1
 
         try:
             # Query enrichment pipeline
-            enriched_data = self.pipeline.enrich(provider.tax_id, provider.name)
+            if enriched_data is None:
+                enriched_data = self.pipeline.enrich(provider.tax_id, provider.name)
 
             if not enriched_data.get("found"):
                 if self.verbose:
@@ -116,7 +162,8 @@ class ProviderBatchEnricher:
             # Save changes
             if updated:
                 if not self.dry_run:
-                    provider.save(update_fields=updated_fields)
+                    if save:
+                        provider.save(update_fields=updated_fields)
                     if self.verbose:
                         logger.info(
                             f"✓ Updated {provider.name}: {', '.join(updated_fields)}"
@@ -131,11 +178,55 @@ class ProviderBatchEnricher:
             return False
 
     def enrich_batch(self, providers: list[Provider]) -> dict:
-        """Enrich a batch of providers."""
-        for provider in providers:
-            self.enrich_provider(provider)
+        """Enrich a batch of providers.
+
+        API lookups run on a thread pool so their round-trips overlap;
+        results are applied on the calling thread, in order, and changed
+        providers are written with bulk_update every SAVE_BATCH_SIZE rows.
+        """
+        dirty: list[Provider] = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.pipeline.enrich, provider.tax_id, provider.name)
+                for provider in providers
+            ]
+
+            for provider, future in zip(providers, futures):
+                try:
+                    enriched_data = future.result()
+                except Exception as e:
+                    logger.error(f"Error enriching {provider.name}: {e}")
+                    self.stats["total"] += 1
+                    self.stats["errors"] += 1
+                    continue
+
+                if self.enrich_provider(provider, enriched_data, save=False) and not self.dry_run:
+                    dirty.append(provider)
+                    if len(dirty) >= self.SAVE_BATCH_SIZE:
+                        self._save_providers(dirty)
+                        dirty = []
+
+        if dirty:
+            self._save_providers(dirty)
+
         return self.stats
 
+    def _save_providers(self, providers: list[Provider]) -> None:
+        """Write enriched providers in one transaction."""
+        try:
+            with transaction.atomic():
+                # Untouched fields are rewritten with the values just loaded
+                Provider.objects.bulk_update(
+                    providers, self.ENRICHED_FIELDS, batch_size=self.SAVE_BATCH_SIZE
+                )
+            # bulk_update sends no post_save, so cached aggregates are expired here
+            invalidate_provider_stats()
+        except Exception as e:
+            logger.error(f"Failed to save batch of {len(providers)} providers: {e}")
+            self.stats["enriched"] -= len(providers)
+            self.stats["errors"] += len(providers)
+
 
 class Command(BaseCommand):
     """Management command to enrich provider data from external APIs."""
@@ -171,6 +262,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Simulate without saving to database"
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=ProviderBatchEnricher.DEFAULT_WORKERS,
+            help="Concurrent API lookups"
+        )
         parser.add_argument(
             "--verbose",
             action="store_true",
@@ -185,6 +282,7 @@ class Command(BaseCommand):
         region = options.get("filter_region")
         flagged_only = options.get("filter_flagged", False)
         high_risk_only = options.get("filter_high_risk", False)
+        workers = options.get("workers")
 
         # Build query filters
         query = Q()
@@ -198,13 +296,21 @@ class Command(BaseCommand):
         if high_risk_only:
             query &= Q(risk_score__gt=Decimal("70"))
 
-        # Fetch providers ordered by amount (process biggest first)
-        providers = Provider.objects.filter(query).order_by("-total_awarded_amount")
+        # Fetch providers ordered by amount (process biggest first), skipping
+        # fully enriched ones so they cost no API round-trip
+        providers = (
+            Provider.objects.filter(query)
+            .filter(NEEDS_ENRICHMENT)
+            .order_by("-total_awarded_amount")
+        )
 
         if limit:
             providers = providers[:limit]
 
-        provider_count = providers.count()
+        # One query: the batch needs the rows anyway, so count them in Python
+        # instead of issuing a separate COUNT(*)
+        providers = list(providers.iterator(chunk_size=500))
+        provider_count = len(providers)
 
         if provider_count == 0:
             self.stdout.write(
@@ -226,8 +332,8 @@ class Command(BaseCommand):
             )
 
         # Process providers
-        enricher = ProviderBatchEnricher(verbose=verbose, dry_run=dry_run)
-        stats = enricher.enrich_batch(list(providers))
+        enricher = ProviderBatchEnricher(verbose=verbose, dry_run=dry_run, workers=workers)
+        stats = enricher.enrich_batch(providers)
 
         # Display results
         self._display_results(stats, dry_run)
@@ -8,107 +8,110 @@ Available sources:
 4. Extract from existing contracts in DB
 """
 
+import heapq
 import requests
 import json
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.db.models import Count
+from django.utils import timezone
 from apps.providers.models import Provider
+from apps.providers.signals import invalidate_provider_stats
 from apps.contracts.models import RawContractData, Contract
 
 logger = __import__('logging').getLogger(__name__)
 
+# Provider fields rewritten when a NIF's name changes
+PROVIDER_UPDATE_FIELDS = ['name', 'legal_name', 'updated_at']
+
+# Company entries read from raw contract data, per source platform:
+# (key, holds a list, source label, overrides NIFs found earlier)
+RAW_CONTRACT_PARTIES = {
+    'BOE': (
+        ('adjudicatario', False, 'BOE-adjudicatario', True),
+        ('licitadores', True, 'BOE-licitador', False),
+        ('proveedores', True, 'BOE-proveedor', False),
+    ),
+    'PCSP': (
+        ('empresa', False, 'PCSP', False),
+    ),
+}
+
+
+def _pick(data, *keys):
+    """Return the first truthy value among keys of a dict, or None."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
 
 class NIFExtractor:
     """Extract NIFs from various sources."""
 
+    @staticmethod
+    def _load_raw_data(raw_data):
+        """Return raw contract data as Python objects.
+
+        raw_data is a JSONField, so Django hands back already-decoded
+        dicts; only rows stored as a JSON string still need parsing.
+        """
+        if isinstance(raw_data, (str, bytes, bytearray)):
+            return json.loads(raw_data)
+        return raw_data
+
     @staticmethod
     def extract_from_contracts():
         """Extract NIFs from contracts already in database."""
         nifs_found = {}
 
-        # From BOE contracts
-        boe_contracts = RawContractData.objects.filter(source_platform='BOE')
-        for contract in boe_contracts:
-            try:
-                data = json.loads(contract.raw_data)
-
-                # Extract adjudicatario (awarded to)
-                if 'adjudicatario' in data:
-                    adj = data['adjudicatario']
-                    nif = adj.get('nif') or adj.get('NIF')
-                    nombre = adj.get('nombre') or adj.get('nombre_empresa')
-                    if nif and nombre:
-                        nifs_found[nif] = {
-                            'name': nombre,
-                            'source': 'BOE-adjudicatario',
-                        }
-
-                # Extract licitadores (bidders)
-                if 'licitadores' in data:
-                    for licitador in data.get('licitadores', []):
-                        nif = licitador.get('nif') or licitador.get('NIF')
-                        nombre = licitador.get('nombre') or licitador.get('nombre_empresa')
-                        if nif and nombre:
-                            if nif not in nifs_found:
-                                nifs_found[nif] = {
-                                    'name': nombre,
-                                    'source': 'BOE-licitador',
-                                }
+        for platform, parties in RAW_CONTRACT_PARTIES.items():
+            # Streamed; only raw_data is loaded per row
+            contracts = (
+                RawContractData.objects.filter(source_platform=platform)
+                .only('raw_data')
+                .iterator(chunk_size=500)
+            )
+            for contract in contracts:
+                try:
+                    data = NIFExtractor._load_raw_data(contract.raw_data)
 
-                # Extract proveedores
-                if 'proveedores' in data:
-                    for proveedor in data.get('proveedores', []):
-                        nif = proveedor.get('nif') or proveedor.get('NIF')
-                        nombre = proveedor.get('nombre') or proveedor.get('nombre_empresa')
-                        if nif and nombre:
-                            if nif not in nifs_found:
+                    for key, is_list, source, overrides in parties:
+                        if key not in data:
+                            continue
+
+                        for party in data[key] if is_list else (data[key],):
+                            nif = _pick(party, 'nif', 'NIF')
+                            nombre = _pick(party, 'nombre', 'nombre_empresa')
+                            if nif and nombre and (overrides or nif not in nifs_found):
                                 nifs_found[nif] = {
                                     'name': nombre,
-                                    'source': 'BOE-proveedor',
+                                    'source': source,
                                 }
-            except Exception as e:
-                logger.warning(f"Error parsing BOE contract: {e}")
-                continue
-
-        # From PCSP contracts
-        pcsp_contracts = RawContractData.objects.filter(source_platform='PCSP')
-        for contract in pcsp_contracts:
-            try:
-                data = json.loads(contract.raw_data)
-
-                if 'empresa' in data:
-                    empresa = data['empresa']
-                    nif = empresa.get('nif') or empresa.get('NIF')
-                    nombre = empresa.get('nombre') or empresa.get('nombre_empresa')
-                    if nif and nombre:
-                        if nif not in nifs_found:
-                            nifs_found[nif] = {
-                                'name': nombre,
-                                'source': 'PCSP',
-                            }
-            except Exception as e:
-                logger.warning(f"Error parsing PCSP contract: {e}")
-                continue
+                except Exception as e:
+                    logger.warning(f"Error parsing {platform} contract: {e}")
+                    continue
 
         return nifs_found
 
     @staticmethod
     def extract_from_normalized_contracts():
         """Extract NIFs from normalized contracts in database."""
-        nifs_found = {}
-
-        # Get awarded_to providers
-        contracts = Contract.objects.filter(awarded_to__isnull=False).select_related('awarded_to')
-        for contract in contracts:
-            if contract.awarded_to:
-                provider = contract.awarded_to
-                nif = provider.tax_id
-                if nif and provider.name:
-                    if nif not in nifs_found:
-                        nifs_found[nif] = {
-                            'name': provider.name,
-                            'source': 'Normalized-Contract',
-                        }
+        # Providers with at least one awarded contract, deduplicated by the
+        # database; all_objects keeps soft-deleted providers that still hold
+        # awarded contracts
+        awarded = Contract.objects.filter(awarded_to__isnull=False).values('awarded_to')
+        providers = Provider.all_objects.filter(pk__in=awarded).values_list('tax_id', 'name')
+
+        nifs_found = {
+            nif: {
+                'name': name,
+                'source': 'Normalized-Contract',
+            }
+            for nif, name in providers.iterator(chunk_size=2000)
+            if nif and name
+        }
 
         return nifs_found
 
@@ -186,7 +189,7 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"\n📌 EXTRACTED {len(nifs_found)} UNIQUE NIFs:\n")
         )
 
-        for i, (nif, data) in enumerate(sorted(nifs_found.items())[:20], 1):
+        for i, (nif, data) in enumerate(heapq.nsmallest(20, nifs_found.items()), 1):
             self.stdout.write(
                 f"  {i:2d}. {nif:12s} → {data['name'][:50]:50s} ({data['source']})"
             )
@@ -206,43 +209,44 @@ class Command(BaseCommand):
                 self.style.SUCCESS(f"{'='*70}\n")
             )
 
-            created = 0
-            updated = 0
             skipped = 0
 
-            for nif, data in nifs_found.items():
-                try:
-                    provider, is_new = Provider.objects.get_or_create(
-                        tax_id=nif,
-                        defaults={
-                            'name': data['name'],
-                            'legal_name': data['name'],
-                        }
-                    )
+            # One lookup for every NIF instead of a get_or_create per NIF;
+            # all_objects so soft-deleted rows are seen (they still hold the unique key)
+            existing = {}
+            nifs = list(nifs_found)
+            for start in range(0, len(nifs), 1000):
+                existing.update(
+                    (provider.tax_id, provider)
+                    for provider in Provider.all_objects.filter(tax_id__in=nifs[start:start + 1000])
+                    .only('id', 'tax_id', 'name', 'legal_name', 'deleted_at')
+                )
 
-                    if is_new:
-                        created += 1
-                        if verbose:
-                            self.stdout.write(
-                                self.style.SUCCESS(f"  ✓ Created: {nif} - {data['name']}")
-                            )
-                    else:
-                        if provider.name != data['name']:
-                            provider.name = data['name']
-                            provider.legal_name = data['name']
-                            provider.save(update_fields=['name', 'legal_name'])
-                            updated += 1
-                            if verbose:
-                                self.stdout.write(
-                                    self.style.SUCCESS(f"  ✓ Updated: {nif} - {data['name']}")
-                                )
-                        else:
-                            skipped += 1
+            to_create = []
+            to_update = []
+            now = timezone.now()
 
-                except Exception as e:
+            for nif, data in nifs_found.items():
+                provider = existing.get(nif)
+
+                if provider is None:
+                    to_create.append(
+                        Provider(tax_id=nif, name=data['name'], legal_name=data['name'])
+                    )
+                elif provider.deleted_at is not None:
                     self.stdout.write(
-                        self.style.ERROR(f"  ✗ Error with {nif}: {e}")
+                        self.style.ERROR(f"  ✗ Error with {nif}: provider is soft-deleted")
                     )
+                elif provider.name != data['name']:
+                    provider.name = data['name']
+                    provider.legal_name = data['name']
+                    # bulk_update() does not apply auto_now
+                    provider.updated_at = now
+                    to_update.append(provider)
+                else:
+                    skipped += 1
+
+            created, updated = self._save_providers(to_create, to_update, verbose)
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -261,3 +265,64 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS("✓ Extraction completed\n")
         )
+
+    def _save_providers(self, to_create, to_update, verbose):
+        """
+        Write new and renamed providers in bulk.
+
+        If the bulk write fails, providers are saved one at a time so a
+        single bad NIF is reported and skipped instead of rolling back the
+        whole import.
+
+        Returns:
+            Tuple of (created, updated) counts
+        """
+        try:
+            with transaction.atomic():
+                if to_create:
+                    Provider.objects.bulk_create(to_create, batch_size=1000)
+                if to_update:
+                    Provider.objects.bulk_update(
+                        to_update, PROVIDER_UPDATE_FIELDS, batch_size=1000
+                    )
+            created, updated = to_create, to_update
+        except Exception as e:
+            self.stdout.write(
+                self.style.WARNING(f"  ⚠ Bulk save failed, saving providers one by one: {e}")
+            )
+            for provider in to_create:
+                # bulk_create() may have assigned ids before the rollback
+                provider.pk = None
+            created = [p for p in to_create if self._save_provider(p, force_insert=True)]
+            updated = [
+                p for p in to_update
+                if self._save_provider(p, update_fields=PROVIDER_UPDATE_FIELDS)
+            ]
+
+        # Bulk writes send no post_save, so cached aggregates are expired here
+        invalidate_provider_stats()
+
+        if verbose:
+            # Reported only once the rows are committed
+            for provider in created:
+                self.stdout.write(
+                    self.style.SUCCESS(f"  ✓ Created: {provider.tax_id} - {provider.name}")
+                )
+            for provider in updated:
+                self.stdout.write(
+                    self.style.SUCCESS(f"  ✓ Updated: {provider.tax_id} - {provider.name}")
+                )
+
+        return len(created), len(updated)
+
+    def _save_provider(self, provider, **save_kwargs):
+        """Save one provider, reporting instead of raising on failure."""
+        try:
+            with transaction.atomic():
+                provider.save(**save_kwargs)
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f"  ✗ Error with {provider.tax_id}: {e}")
+            )
+            return False
+        return True
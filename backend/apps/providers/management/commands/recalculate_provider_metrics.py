@@ -6,16 +6,31 @@ Usage:
     python manage.py recalculate_provider_metrics --id 36  # Single provider
 """
 from django.core.management.base import BaseCommand
-from django.db.models import Count, Sum, DecimalField, F, Min, Max
+from django.db import transaction
+from django.db.models import Count, Sum, DecimalField, ExpressionWrapper, F, Min, Max
 from django.db.models.functions import Coalesce
 
 from apps.providers.models import Provider
+from apps.providers.signals import invalidate_provider_stats
 from apps.contracts.models import Contract
 
 
+METRIC_FIELDS = [
+    "total_contracts",
+    "total_awarded_amount",
+    "avg_contract_amount",
+    "success_rate",
+    "first_contract_date",
+    "last_contract_date",
+]
+
+
 class Command(BaseCommand):
     """Command to recalculate provider metrics from related contracts."""
 
+    # Providers written per bulk_update round-trip
+    save_batch_size = 1000
+
     help = "Recalculate provider metrics based on awarded contracts"
 
     def add_arguments(self, parser) -> None:
@@ -31,10 +46,11 @@ class Command(BaseCommand):
         # Get providers to recalculate
         if options.get("id"):
             providers = Provider.objects.filter(id=options["id"])
+            # Primary key lookup; no COUNT(*) needed for at most one row
+            total = 1 if providers.exists() else 0
         else:
             providers = Provider.objects.all()
-
-        total = providers.count()
+            total = providers.count()
 
         if total == 0:
             self.stdout.write(self.style.WARNING("No providers to recalculate"))
@@ -44,54 +60,74 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"\nRecalculating metrics for {total} provider(s)...\n")
         )
 
-        updated = 0
-        for provider in providers:
-            # Get all contracts where this provider was awarded_to
-            contracts = Contract.objects.filter(awarded_to=provider)
-
-            # Calculate metrics
-            total_contracts = contracts.count()
-            total_awarded = contracts.aggregate(
-                total=Coalesce(Sum("awarded_amount"), 0, output_field=DecimalField())
-            )["total"] or 0
-
-            avg_contract = (
-                total_awarded / total_contracts if total_contracts > 0 else 0
+        # Contract metrics for all providers from one grouped query
+        metrics = {
+            row["awarded_to"]: row
+            for row in Contract.objects.filter(awarded_to__in=providers.values("id"))
+            .values("awarded_to")
+            .annotate(
+                total_contracts=Count("id"),
+                total_awarded=Coalesce(Sum("awarded_amount"), 0, output_field=DecimalField()),
+                first=Min("publication_date"),
+                last=Max("publication_date"),
+            )
+            # Over every awarded contract, so contracts without an amount
+            # count as zero (Avg would skip them)
+            .annotate(
+                avg_contract=ExpressionWrapper(
+                    F("total_awarded") / F("total_contracts"), output_field=DecimalField()
+                ),
             )
+            .order_by()
+        }
+
+        updated = 0
+        pending = []
+        # Progress lines are written once per saved batch rather than per provider
+        lines = []
+        # Streamed so only one batch of providers is held in memory
+        for provider in providers.only("id", "name").iterator(chunk_size=2000):
+            row = metrics.get(provider.pk, {})
+            total_contracts = row.get("total_contracts", 0)
+            total_awarded = row.get("total_awarded") or 0
+            avg_contract = row.get("avg_contract") or 0
 
             # For now, success_rate is the percentage of contracts (100% if has any)
             success_rate = 100 if total_contracts > 0 else 0
 
-            # Get date range
-            date_range = contracts.aggregate(
-                first=Min("publication_date"),
-                last=Max("publication_date"),
-            )
-
             # Update provider
             provider.total_contracts = total_contracts
             provider.total_awarded_amount = total_awarded
             provider.avg_contract_amount = avg_contract
             provider.success_rate = success_rate
-            provider.first_contract_date = date_range.get("first")
-            provider.last_contract_date = date_range.get("last")
-            provider.save(
-                update_fields=[
-                    "total_contracts",
-                    "total_awarded_amount",
-                    "avg_contract_amount",
-                    "success_rate",
-                    "first_contract_date",
-                    "last_contract_date",
-                ]
-            )
+            provider.first_contract_date = row.get("first")
+            provider.last_contract_date = row.get("last")
+            pending.append(provider)
 
-            updated += 1
-            self.stdout.write(
+            lines.append(
                 f"  ✓ {provider.name}: {total_contracts} contracts, "
                 f"€{total_awarded:,.2f} awarded"
             )
 
+            if len(pending) >= self.save_batch_size:
+                updated += self._save_metrics(pending)
+                self.stdout.write("\n".join(lines))
+                pending = []
+                lines = []
+
+        if pending:
+            updated += self._save_metrics(pending)
+            self.stdout.write("\n".join(lines))
+
+        # bulk_update sends no post_save, so cached aggregates are expired here
+        invalidate_provider_stats()
+
         self.stdout.write(
             self.style.SUCCESS(f"\n✓ Completed: {updated} provider(s) updated\n")
         )
+
+    def _save_metrics(self, providers: list[Provider]) -> int:
+        """Write recalculated metrics for a batch of providers."""
+        with transaction.atomic():
+            Provider.objects.bulk_update(providers, METRIC_FIELDS, batch_size=self.save_batch_size)
+        return len(providers)
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-16 10:40
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='provider',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='prov_name_trgm_ix', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='provider',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tax_id'], name='prov_tax_id_trgm_ix', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='provider',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['legal_name'], name='prov_legal_name_trgm_ix', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,6 +1,7 @@
 """Provider models."""
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
@@ -68,6 +69,12 @@ class Provider(SoftDeleteModel):
         indexes = [
             models.Index(fields=["region", "industry"]),
             models.Index(fields=["risk_score"]),
+            # Trigram indexes serve the icontains (ILIKE '%...%') search filters
+            GinIndex(fields=["name"], name="prov_name_trgm_ix", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["tax_id"], name="prov_tax_id_trgm_ix", opclasses=["gin_trgm_ops"]),
+            GinIndex(
+                fields=["legal_name"], name="prov_legal_name_trgm_ix", opclasses=["gin_trgm_ops"]
+            ),
         ]
 
     def __str__(self) -> str:
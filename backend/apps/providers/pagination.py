@@ -0,0 +1,54 @@
+"""Pagination for providers API."""
+import hashlib
+from functools import cached_property, partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from rest_framework.pagination import PageNumberPagination
+
+from apps.providers.signals import get_stats_version
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reads the total row count from the cache."""
+
+    def __init__(self, *args, cache_key: str, cache_timeout: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.cache_timeout = cache_timeout
+
+    @cached_property
+    def count(self) -> int:
+        """Return the total number of objects, counting them on a cache miss."""
+        return cache.get_or_set(self.cache_key, self.object_list.count, self.cache_timeout)
+
+
+class ProviderPagination(PageNumberPagination):
+    """
+    Page number pagination with the provider count cached per query string.
+
+    The page itself is always read from the database; only the COUNT(*)
+    behind ``count`` is reused until providers change or it expires. Other
+    actions (a provider's contracts, alerts...) paginate uncached, as does
+    everything without SHARED_CACHE, since a per-process cache never sees
+    invalidations from management commands or Celery workers.
+    """
+
+    count_cache_timeout = 300
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset, keying the cached count on the filters."""
+        if not settings.SHARED_CACHE or getattr(view, "action", None) != "list":
+            self.django_paginator_class = Paginator
+            return super().paginate_queryset(queryset, request, view)
+
+        params = request.query_params.copy()
+        params.pop(self.page_query_param, None)
+        query = hashlib.sha1(params.urlencode().encode()).hexdigest()
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            cache_key=f"providers:count:{get_stats_version()}:{query}",
+            cache_timeout=self.count_cache_timeout,
+        )
+        return super().paginate_queryset(queryset, request, view)
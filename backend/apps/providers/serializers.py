@@ -28,6 +28,18 @@ class ProviderListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        Initialize the serializer.
+
+        Args:
+            fields: Names of the fields to output; all fields when omitted
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
 
 class ProviderDetailSerializer(serializers.ModelSerializer):
     """Full provider details."""
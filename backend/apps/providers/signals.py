@@ -0,0 +1,37 @@
+"""Signal handlers and cache helpers for providers."""
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.providers.models import Provider
+
+# Part of every cached provider aggregate key; bumping it expires them all
+STATS_VERSION_KEY = "providers:stats:version"
+
+
+def get_stats_version() -> int:
+    """Return the current version of cached provider aggregates."""
+    # Seeded from the clock so an evicted counter never reuses an old version
+    return cache.get_or_set(STATS_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_provider_stats() -> None:
+    """
+    Expire every cached provider aggregate response.
+
+    Saves and deletes trigger this through signals; bulk writers
+    (bulk_create/bulk_update skip signals) call it directly.
+    """
+    try:
+        cache.incr(STATS_VERSION_KEY)
+    except ValueError:
+        cache.set(STATS_VERSION_KEY, time.time_ns(), None)
+
+
+@receiver(post_save, sender=Provider)
+@receiver(post_delete, sender=Provider)
+def provider_changed(sender, **kwargs) -> None:
+    """Expire cached aggregates when a provider changes."""
+    invalidate_provider_stats()
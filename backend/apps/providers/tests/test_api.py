@@ -1,14 +1,16 @@
 """Tests for providers API."""
 from decimal import Decimal
+from unittest.mock import Mock, patch
 
 import pytest
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from apps.contracts.models import Contract
-from apps.providers.models import Provider, ProviderAlert
+from apps.providers.models import Provider, ProviderAlert, ProviderRelationship
 
 
 @pytest.mark.django_db
@@ -37,6 +39,40 @@ class TestProviderAPI(APITestCase):
         assert response.data["count"] == 1
         assert response.data["results"][0]["tax_id"] == "B12345678"
 
+    @override_settings(SHARED_CACHE=True)
+    def test_list_count_refreshed_on_save(self):
+        """Test the cached list count follows provider changes."""
+        url = reverse("provider-list")
+        assert self.client.get(url).data["count"] == 1
+
+        Provider.objects.create(name="Second Provider", tax_id="B87654321")
+
+        response = self.client.get(url)
+        assert response.data["count"] == 2
+        assert len(response.data["results"]) == 2
+
+    @override_settings(SHARED_CACHE=True, ALLOWED_HOSTS=["a.example.com", "b.example.com"])
+    def test_list_page_cache_keyed_on_host(self):
+        """Test cached pages keep the pagination links of the host that asked."""
+        Provider.objects.bulk_create(
+            Provider(name=f"Provider {i}", tax_id=f"B{i:08d}") for i in range(100)
+        )
+
+        url = reverse("provider-list")
+        first = self.client.get(url, HTTP_HOST="a.example.com")
+        second = self.client.get(url, HTTP_HOST="b.example.com")
+
+        assert first.data["next"].startswith("http://a.example.com/")
+        assert second.data["next"].startswith("http://b.example.com/")
+
+    def test_list_selected_fields(self):
+        """Test listing only the fields requested with ?fields=."""
+        url = reverse("provider-list")
+        response = self.client.get(url, {"fields": "id,name,risk_score,unknown"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["results"][0]) == {"id", "name", "risk_score"}
+
     def test_retrieve_provider(self):
         """Test retrieving provider detail."""
         url = reverse("provider-detail", kwargs={"pk": self.provider.pk})
@@ -97,6 +133,48 @@ class TestProviderAPI(APITestCase):
         assert response.data["total_providers"] == 1
         assert response.data["total_contracts"] == 10
 
+    @override_settings(SHARED_CACHE=True)
+    def test_provider_stats_cache_invalidated_on_save(self):
+        """Test cached statistics are refreshed when a provider is saved."""
+        url = reverse("provider-stats")
+        assert self.client.get(url).data["total_providers"] == 1
+
+        Provider.objects.create(name="Second Provider", tax_id="B87654321", total_contracts=5)
+
+        response = self.client.get(url)
+        assert response.data["total_providers"] == 2
+        assert response.data["total_contracts"] == 15
+
+    def test_provider_summary(self):
+        """Test the summary endpoint matches the individual aggregate endpoints."""
+        Provider.objects.create(
+            name="Second Provider",
+            tax_id="B87654321",
+            region="Madrid",
+            industry="Services",
+            total_contracts=4,
+            total_awarded_amount=Decimal("500000"),
+            risk_score=Decimal("80"),
+            is_flagged=True,
+        )
+
+        response = self.client.get(reverse("provider-summary"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["stats"]["total_providers"] == 2
+        assert response.data["stats"]["total_contracts"] == 14
+        assert response.data["stats"]["flagged_count"] == 1
+        assert response.data["stats"]["high_risk_count"] == 1
+        assert len(response.data["by_region"]) == 1
+        assert response.data["by_region"][0]["count"] == 2
+        assert response.data["by_region"][0]["avg_risk_score"] == Decimal("57.75")
+        assert {row["industry"] for row in response.data["by_industry"]} == {
+            "Construction",
+            "Services",
+        }
+        assert self.client.get(reverse("provider-stats")).data == response.data["stats"]
+        assert self.client.get(reverse("provider-by-region")).data == response.data["by_region"]
+
     def test_provider_contracts(self):
         """Test retrieving provider's contracts."""
         # Create contracts for provider
@@ -134,8 +212,68 @@ class TestProviderAPI(APITestCase):
         response = self.client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["severity"] == "HIGH"
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["severity"] == "HIGH"
+
+    def test_provider_relationships(self):
+        """Test retrieving relationships on either side of a provider."""
+        partner = Provider.objects.create(name="Partner", tax_id="B11111111")
+        parent = Provider.objects.create(name="Parent", tax_id="B22222222")
+        ProviderRelationship.objects.create(
+            provider_a=self.provider,
+            provider_b=partner,
+            relationship_type="SHARED_ADDRESS",
+            confidence=Decimal("60"),
+        )
+        ProviderRelationship.objects.create(
+            provider_a=parent,
+            provider_b=self.provider,
+            relationship_type="SUBSIDIARY",
+            confidence=Decimal("90"),
+        )
+        ProviderRelationship.objects.create(
+            provider_a=parent,
+            provider_b=partner,
+            relationship_type="SUBSIDIARY",
+            confidence=Decimal("80"),
+        )
+
+        url = reverse("provider-relationships", kwargs={"pk": self.provider.pk})
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert response.data["count"] == 2
+        assert [r["relationship_type"] for r in results] == ["SUBSIDIARY", "SHARED_ADDRESS"]
+        assert results[0]["provider_a_name"] == "Parent"
+
+    @patch("apps.providers.views.analyze_provider_task.delay")
+    def test_analyze_queues_task(self, mock_delay):
+        """Test analysis is queued instead of run in the request."""
+        mock_delay.return_value = Mock(id="task-123")
+
+        url = reverse("provider-analyze", kwargs={"pk": self.provider.pk})
+        response = self.client.post(url)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["task_id"] == "task-123"
+        mock_delay.assert_called_once_with(self.provider.pk)
+
+    @patch("apps.providers.views.AsyncResult")
+    def test_analysis_result(self, mock_result):
+        """Test polling a finished analysis."""
+        mock_result.return_value = Mock(
+            state="SUCCESS",
+            result={"score": 42.0},
+            successful=Mock(return_value=True),
+        )
+
+        url = reverse("provider-analysis", kwargs={"task_id": "task-123"})
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "SUCCESS"
+        assert response.data["result"] == {"score": 42.0}
 
     def test_by_region(self):
         """Test grouping by region."""
@@ -216,5 +354,5 @@ class TestProviderAlertAPI(APITestCase):
         response = self.client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["severity"] == "CRITICAL"
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["severity"] == "CRITICAL"
@@ -1,14 +1,20 @@
 """Views for providers API."""
-from django.db.models import Avg, Count, Q, Sum
+import hashlib
+
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
 from django_filters import rest_framework as filters
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from apps.analytics.services.risk_calculator import RiskCalculator
+from apps.analytics.tasks import analyze_provider_task
 from apps.contracts.models import Contract
 from apps.contracts.serializers import ContractListSerializer
 from apps.providers.models import Provider, ProviderAlert, ProviderRelationship
+from apps.providers.pagination import ProviderPagination
 from apps.providers.serializers import (
     ProviderAlertSerializer,
     ProviderDetailSerializer,
@@ -16,6 +22,7 @@ from apps.providers.serializers import (
     ProviderRelationshipSerializer,
     ProviderStatsSerializer,
 )
+from apps.providers.signals import get_stats_version
 
 
 class ProviderFilter(filters.FilterSet):
@@ -65,6 +72,7 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
     """
 
     queryset = Provider.objects.order_by("-total_awarded_amount")
+    pagination_class = ProviderPagination
     filterset_class = ProviderFilter
     search_fields = ["name", "tax_id", "legal_name"]
     ordering_fields = [
@@ -74,28 +82,83 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
         "success_rate",
     ]
 
+    # Aggregate endpoints scan the whole (filtered) table; with SHARED_CACHE
+    # their responses are cached per query string until providers change or
+    # this expires
+    stats_cache_timeout = 300
+    # List pages are cached the same way, for less time
+    list_cache_timeout = 60
+
+    # Columns behind list serializer fields that are not model fields
+    list_columns = {"years_active": "first_contract_date"}
+
+    def get_queryset(self):
+        """Return providers, loading only the listed columns for the list action."""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            fields = self._requested_fields() or ProviderListSerializer.Meta.fields
+            queryset = queryset.only("id", *(self.list_columns.get(f, f) for f in fields))
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        """Return the serializer, limited to the requested list fields."""
+        if fields := self._requested_fields():
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def _requested_fields(self) -> list[str] | None:
+        """
+        Return the list fields selected with ?fields=a,b,c.
+
+        Unknown names are ignored; None means every field.
+        """
+        if self.action != "list":
+            return None
+        raw = self.request.query_params.get("fields", "")
+        requested = [f for f in raw.split(",") if f in ProviderListSerializer.Meta.fields]
+        return requested or None
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == "retrieve":
             return ProviderDetailSerializer
         return ProviderListSerializer
 
-    @action(detail=False, methods=["get"])
-    def stats(self, _request):
-        """Get provider statistics."""
-        queryset = self.filter_queryset(self.get_queryset())
+    def _cached_response(self, compute, timeout, name=None):
+        """Return cached response data, computing it on a miss.
 
-        stats = queryset.aggregate(
-            total_providers=Count("id"),
-            total_contracts=Sum("total_contracts"),
-            total_awarded=Sum("total_awarded_amount"),
-            flagged_count=Count("id", filter=Q(is_flagged=True)),
-            high_risk_count=Count("id", filter=Q(risk_score__gt=70)),
-            avg_success_rate=Avg("success_rate"),
+        Nothing is cached without SHARED_CACHE: with a per-process cache,
+        invalidations from management commands and Celery workers never
+        reach the web workers.
+
+        Args:
+            compute: Callable producing the data
+            timeout: Cache timeout in seconds
+            name: Cache entry name; defaults to the action, actions serving
+                slices of the same data pass a shared name
+        """
+        if not settings.SHARED_CACHE:
+            return compute()
+
+        # Paginated responses embed absolute next/previous links, so the
+        # scheme and host are part of the key alongside the query string
+        url = f"{self.request.scheme}://{self.request.get_host()}?{self.request.GET.urlencode()}"
+        query = hashlib.sha1(url.encode()).hexdigest()
+        key = f"providers:{name or self.action}:{get_stats_version()}:{query}"
+        return cache.get_or_set(key, compute, timeout)
+
+    def list(self, request, *args, **kwargs):
+        """List providers, reusing recently served pages."""
+        data = self._cached_response(
+            lambda: super(ProviderViewSet, self).list(request, *args, **kwargs).data,
+            self.list_cache_timeout,
         )
+        return Response(data)
 
-        serializer = ProviderStatsSerializer(stats)
-        return Response(serializer.data)
+    @action(detail=False, methods=["get"])
+    def stats(self, _request):
+        """Get provider statistics."""
+        return Response(self._summary()["stats"])
 
     @action(detail=True, methods=["get"])
     def contracts(self, request, pk=None):
@@ -105,7 +168,11 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
         Returns all contracts awarded to this provider.
         """
         provider = self.get_object()
-        contracts = Contract.objects.filter(awarded_to=provider).order_by("-award_date")
+        contracts = (
+            Contract.objects.filter(awarded_to=provider)
+            .select_related("awarded_to")
+            .order_by("-award_date")
+        )
 
         # Apply pagination
         page = self.paginate_queryset(contracts)
@@ -125,6 +192,13 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
         """
         provider = self.get_object()
         alerts = provider.alerts.all().order_by("-created_at")
+
+        # Apply pagination
+        page = self.paginate_queryset(alerts)
+        if page is not None:
+            serializer = ProviderAlertSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = ProviderAlertSerializer(alerts, many=True)
         return Response(serializer.data)
 
@@ -136,9 +210,19 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
         Returns all flagged relationships for this provider.
         """
         provider = self.get_object()
-        relationships = ProviderRelationship.objects.filter(
-            Q(provider_a=provider) | Q(provider_b=provider)
-        ).order_by("-confidence")
+        # One indexed lookup per side instead of an OR across both foreign keys
+        related = ProviderRelationship.objects.select_related("provider_a", "provider_b")
+        relationships = (
+            related.filter(provider_a=provider)
+            .union(related.filter(provider_b=provider).exclude(provider_a=provider), all=True)
+            .order_by("-confidence")
+        )
+
+        # Apply pagination
+        page = self.paginate_queryset(relationships)
+        if page is not None:
+            serializer = ProviderRelationshipSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
 
         serializer = ProviderRelationshipSerializer(relationships, many=True)
         return Response(serializer.data)
@@ -148,51 +232,144 @@ class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Trigger risk analysis for provider.
 
-        Runs AI analysis and returns results.
+        Queues the AI analysis on Celery and returns the task id; poll
+        the analysis endpoint for the results.
         """
         provider = self.get_object()
-        calculator = RiskCalculator()
+        task = analyze_provider_task.delay(provider.pk)
+        return Response({"task_id": task.id}, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["get"], url_path=r"analysis/(?P<task_id>[^/.]+)")
+    def analysis(self, request, task_id=None):
+        """
+        Get the state of a queued provider analysis.
 
-        try:
-            analysis = calculator.analyze_provider(provider)
-            return Response(analysis)
-        except Exception as e:
-            return Response({"error": str(e)}, status=500)
+        Includes the results once the task has finished.
+        """
+        result = AsyncResult(task_id)
+        data = {"task_id": task_id, "status": result.state}
+
+        if result.successful():
+            data["result"] = result.result
+        elif result.failed():
+            data["error"] = str(result.result)
+
+        return Response(data)
 
     @action(detail=False, methods=["get"])
     def by_region(self, _request):
         """Group providers by region."""
-        queryset = self.filter_queryset(self.get_queryset())
-
-        regions = (
-            queryset.values("region")
-            .annotate(
-                count=Count("id"),
-                total_contracts=Sum("total_contracts"),
-                total_awarded=Sum("total_awarded_amount"),
-                avg_risk_score=Avg("risk_score"),
-            )
-            .order_by("-total_awarded")
-        )
-
-        return Response(regions)
+        return Response(self._summary()["by_region"])
 
     @action(detail=False, methods=["get"])
     def by_industry(self, _request):
         """Group providers by industry."""
+        return Response(self._summary()["by_industry"])
+
+    @action(detail=False, methods=["get"])
+    def summary(self, _request):
+        """Get statistics and region/industry breakdowns in one response."""
+        return Response(self._summary())
+
+    def _summary(self) -> dict:
+        """Return the cached summary shared by stats, by_region and by_industry."""
+        return self._cached_response(
+            self._compute_summary, self.stats_cache_timeout, name="summary"
+        )
+
+    def _compute_summary(self) -> dict:
         queryset = self.filter_queryset(self.get_queryset())
 
-        industries = (
-            queryset.values("industry")
+        # One query grouped by (region, industry); the endpoints' figures are
+        # sums over these groups, averages are rebuilt from sums and counts
+        groups = list(
+            queryset.values("region", "industry")
             .annotate(
                 count=Count("id"),
                 total_contracts=Sum("total_contracts"),
                 total_awarded=Sum("total_awarded_amount"),
+                flagged_count=Count("id", filter=Q(is_flagged=True)),
+                high_risk_count=Count("id", filter=Q(risk_score__gt=70)),
+                success_rate_sum=Sum("success_rate"),
+                risk_score_sum=Sum("risk_score"),
+                risk_score_count=Count("risk_score"),
             )
-            .order_by("-count")
+            .order_by()
         )
 
-        return Response(industries)
+        (total,) = _rollup(groups, None) or [dict.fromkeys(_SUMMARY_SUMS, 0)]
+        stats = {
+            "total_providers": total["count"],
+            # Sums over no providers are null, as with a plain aggregate
+            "total_contracts": total["total_contracts"] if groups else None,
+            "total_awarded": total["total_awarded"] if groups else None,
+            "flagged_count": total["flagged_count"],
+            "high_risk_count": total["high_risk_count"],
+            "avg_success_rate": _average(total, "success_rate_sum", "count"),
+        }
+
+        regions = sorted(
+            _rollup(groups, "region"), key=lambda row: row["total_awarded"], reverse=True
+        )
+        industries = sorted(
+            _rollup(groups, "industry"), key=lambda row: row["count"], reverse=True
+        )
+
+        return {
+            "stats": dict(ProviderStatsSerializer(stats).data),
+            "by_region": [
+                {
+                    "region": row["region"],
+                    "count": row["count"],
+                    "total_contracts": row["total_contracts"],
+                    "total_awarded": row["total_awarded"],
+                    "avg_risk_score": _average(row, "risk_score_sum", "risk_score_count"),
+                }
+                for row in regions
+            ],
+            "by_industry": [
+                {
+                    "industry": row["industry"],
+                    "count": row["count"],
+                    "total_contracts": row["total_contracts"],
+                    "total_awarded": row["total_awarded"],
+                }
+                for row in industries
+            ],
+        }
+
+
+# Per-group figures that add up across groups
+_SUMMARY_SUMS = (
+    "count",
+    "total_contracts",
+    "total_awarded",
+    "flagged_count",
+    "high_risk_count",
+    "success_rate_sum",
+    "risk_score_sum",
+    "risk_score_count",
+)
+
+
+def _rollup(groups: list[dict], key: str | None) -> list[dict]:
+    """Add up summary groups sharing the same value of key (all of them for None)."""
+    merged = {}
+    for group in groups:
+        value = group[key] if key else None
+        row = merged.get(value)
+        if row is None:
+            row = merged[value] = dict.fromkeys(_SUMMARY_SUMS, 0)
+            if key:
+                row[key] = value
+        for field in _SUMMARY_SUMS:
+            row[field] += group[field] or 0
+    return list(merged.values())
+
+
+def _average(row: dict, total_field: str, count_field: str):
+    """Divide a summed total by its count, None when nothing was counted."""
+    return row[total_field] / row[count_field] if row[count_field] else None
 
 
 class ProviderAlertViewSet(viewsets.ReadOnlyModelViewSet):
@@ -202,7 +379,27 @@ class ProviderAlertViewSet(viewsets.ReadOnlyModelViewSet):
     Read-only access to alerts with filtering.
     """
 
-    queryset = ProviderAlert.objects.select_related("provider").order_by("-created_at")
+    # Only the provider columns the serializer shows are joined in
+    queryset = (
+        ProviderAlert.objects.select_related("provider")
+        .only(
+            "id",
+            "provider",
+            "provider__name",
+            "provider__tax_id",
+            "severity",
+            "alert_type",
+            "title",
+            "description",
+            "evidence",
+            "is_resolved",
+            "resolved_at",
+            "resolution_notes",
+            "created_at",
+            "updated_at",
+        )
+        .order_by("-created_at")
+    )
     serializer_class = ProviderAlertSerializer
     filterset_fields = ["provider", "severity", "alert_type", "is_resolved"]
     ordering_fields = ["created_at", "severity"]
@@ -233,5 +430,12 @@ class ProviderAlertViewSet(viewsets.ReadOnlyModelViewSet):
         Returns all critical severity alerts.
         """
         alerts = self.get_queryset().filter(severity="CRITICAL", is_resolved=False)
+
+        # Apply pagination
+        page = self.paginate_queryset(alerts)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(alerts, many=True)
         return Response(serializer.data)
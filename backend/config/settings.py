@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party
     "rest_framework",
     "django_filters",
@@ -72,7 +73,9 @@ WSGI_APPLICATION = "config.wsgi.application"
 DATABASES = {}
 
 if config("DATABASE_URL", default=None):
-    DATABASES["default"] = dj_database_url.config(default=config("DATABASE_URL"), conn_max_age=600)
+    DATABASES["default"] = dj_database_url.config(
+        default=config("DATABASE_URL"), conn_max_age=600, conn_health_checks=True
+    )
 else:
     DATABASES["default"] = {
         "ENGINE": "django.db.backends.postgresql",
@@ -81,6 +84,21 @@ else:
         "PASSWORD": config("DB_PASSWORD", default="publicworks"),
         "HOST": config("DB_HOST", default="db"),
         "PORT": config("DB_PORT", default="5432"),
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+    }
+
+# Cache: Redis when configured (shared by all workers), local memory otherwise.
+# Caches that must see invalidations from other processes (management
+# commands, Celery workers) are only enabled with a shared cache.
+SHARED_CACHE = bool(config("REDIS_URL", default=None))
+if SHARED_CACHE:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": config("REDIS_URL"),
+            "KEY_PREFIX": "publicworks",
+        }
     }
 
 # Password validation
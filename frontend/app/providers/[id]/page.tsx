@@ -45,7 +45,7 @@ export default function ProviderDetailPage({ params }: PageProps) {
 
         setProvider(providerData);
         setContracts(contractsData);
-        setAlerts(alertsData);
+        setAlerts(alertsData.results);
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Failed to load provider');
       } finally {
@@ -193,7 +193,7 @@ class APIClient {
     return this.request(`/providers/${id}/contracts/`);
   }
 
-  async getProviderAlerts(id: number): Promise<Alert[]> {
+  async getProviderAlerts(id: number): Promise<PaginatedResponse<Alert>> {
     return this.request(`/providers/${id}/alerts/`);
   }
 